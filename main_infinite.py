@@ -8,15 +8,29 @@ This integrates the beautiful CLI with infinite iterations.
 
 import asyncio
 import argparse
+import re
 import sys
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# libuv-backed event loop when installed - the orchestrator spends its time on subprocesses and sockets
+try:
+    from uvloop import run as run_event_loop
+except ImportError:
+    from asyncio import run as run_event_loop
+
 # Add project to path
 sys.path.append(str(Path(__file__).parent))
 
-from orchestrator.infinite_orchestrator import InfiniteOrchestrator
-from ui.beautiful_cli import beautiful_cli
+# Heavy imports (orchestrator, model client, Rich UI) are deferred into the
+# command handlers so `--help` and `status` don't pay for them.
 
 # Set up beautiful logging
 logging.basicConfig(
@@ -25,8 +39,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def main():
-    """Main CLI interface for infinite AI development"""
+# Characters stripped from requirements when deriving a project name
+_SLUG_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+def _add_build_parser(subparsers):
+    """Register the build command"""
+    build_parser = subparsers.add_parser('build', help='Build a project with infinite iterations')
+    build_parser.add_argument('requirements', help='Natural language description of what to build')
+    build_parser.add_argument('--project', '-p', help='Project name (auto-generated if not provided)')
+    build_parser.add_argument('--max-iterations', '-i', type=int, default=1000, help='Maximum iterations (default: 1000)')
+
+def _add_resume_parser(subparsers):
+    """Register the resume command"""
+    resume_parser = subparsers.add_parser('resume', help='Resume a previous infinite run')
+    resume_parser.add_argument('run_id', help='Run ID to resume')
+
+def _add_status_parser(subparsers):
+    """Register the status command"""
+    status_parser = subparsers.add_parser('status', help='Check status of an infinite run')
+    status_parser.add_argument('run_id', help='Run ID to check')
+
+def _add_test_parser(subparsers):
+    """Register the test command"""
+    test_parser = subparsers.add_parser('test', help='Test the infinite orchestrator')
+    test_parser.add_argument('--simple', action='store_true', help='Run a simple test project')
+
+# Subcommand name -> function that registers only that subparser
+SUBPARSER_BUILDERS = {
+    'build': _add_build_parser,
+    'resume': _add_resume_parser,
+    'status': _add_status_parser,
+    'test': _add_test_parser,
+}
+
+def parse_args(argv=None):
+    """Parse CLI arguments, registering only the subparser that was selected"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast path: `status <run_id>` needs no argparse machinery at all
+    if len(argv) == 2 and argv[0] == 'status' and not argv[1].startswith('-'):
+        return None, argparse.Namespace(command='status', run_id=argv[1])
     
     parser = argparse.ArgumentParser(
         description="♾️ Infinite AI Developer - Build perfect software with unlimited iterations",
@@ -42,28 +95,24 @@ Examples:
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Build command
-    build_parser = subparsers.add_parser('build', help='Build a project with infinite iterations')
-    build_parser.add_argument('requirements', help='Natural language description of what to build')
-    build_parser.add_argument('--project', '-p', help='Project name (auto-generated if not provided)')
-    build_parser.add_argument('--max-iterations', '-i', type=int, default=1000, help='Maximum iterations (default: 1000)')
-    
-    # Resume command
-    resume_parser = subparsers.add_parser('resume', help='Resume a previous infinite run')
-    resume_parser.add_argument('run_id', help='Run ID to resume')
-    
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Check status of an infinite run')
-    status_parser.add_argument('run_id', help='Run ID to check')
+    # Only build the chosen subcommand; fall back to all of them for help/unknown input
+    command = argv[0] if argv else None
+    if command in SUBPARSER_BUILDERS:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_parser in SUBPARSER_BUILDERS.values():
+            add_parser(subparsers)
     
-    # Test command
-    test_parser = subparsers.add_parser('test', help='Test the infinite orchestrator')
-    test_parser.add_argument('--simple', action='store_true', help='Run a simple test project')
+    return parser, parser.parse_args(argv)
+
+async def main():
+    """Main CLI interface for infinite AI development"""
     
-    args = parser.parse_args()
+    parser, args = parse_args()
     
     if not args.command:
         # Show beautiful banner and help
+        from ui.beautiful_cli import beautiful_cli
         beautiful_cli.show_banner()
         parser.print_help()
         return
@@ -90,10 +139,9 @@ async def handle_build_command(args):
     # Generate project name if not provided
     project_name = args.project
     if not project_name:
-        import re
         from datetime import datetime
         # Create project name from requirements
-        clean_req = re.sub(r'[^a-zA-Z0-9\s]', '', args.requirements.lower())
+        clean_req = _SLUG_RE.sub('', args.requirements.lower())
         words = clean_req.split()[:3]  # First 3 words
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         project_name = f"{'_'.join(words)}_{timestamp}"
@@ -105,6 +153,7 @@ async def handle_build_command(args):
     print(f"🎯 Goal: Perfect, production-ready application!")
     
     # Initialize the infinite orchestrator
+    from orchestrator.infinite_orchestrator import InfiniteOrchestrator
     orchestrator = InfiniteOrchestrator()
     
     # Override max iterations if specified
@@ -139,6 +188,7 @@ async def handle_resume_command(args):
     """Handle the resume command"""
     print(f"♾️ Resuming infinite development: {args.run_id}")
     
+    from orchestrator.infinite_orchestrator import InfiniteOrchestrator
     orchestrator = InfiniteOrchestrator()
     
     try:
@@ -155,17 +205,33 @@ async def handle_resume_command(args):
     except Exception as e:
         print(f"❌ Resume failed: {e}")
 
+def _read_last_log_entry(log_file: Path, tail_bytes: int = 4096):
+    """Parse the last line of a run log, reading only its tail"""
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(0, 2)
+            f.seek(max(0, f.tell() - tail_bytes))
+            lines = f.read().splitlines()
+        return (orjson.loads(lines[-1]) if ORJSON_AVAILABLE else json.loads(lines[-1])) if lines else None
+    except (OSError, ValueError):
+        return None
+
 async def handle_status_command(args):
     """Handle the status command"""
     print(f"📊 Checking infinite development status: {args.run_id}")
     
     try:
-        import json
         state_file = Path(f"memory/states/{args.run_id}.json")
         
         if state_file.exists():
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            # Read off the event loop so large state files don't stall it
+            raw_state = await asyncio.to_thread(state_file.read_bytes)
+            state = orjson.loads(raw_state) if ORJSON_AVAILABLE else json.loads(raw_state)
+            
+            # Counters saved since the last snapshot live in the run log
+            latest = await asyncio.to_thread(_read_last_log_entry, state_file.with_suffix(".log.jsonl"))
+            if latest and latest.get('iteration', 0) > state.get('iteration', 0):
+                state.update(latest)
             
             print(f"📁 Project: {state.get('project_path', 'Unknown')}")
             print(f"🔄 Phase: {state.get('phase', 'Unknown')}")
@@ -190,6 +256,7 @@ async def handle_test_command(args):
     """Handle the test command"""
     print(f"🧪 Testing Infinite AI Orchestrator...")
     
+    from orchestrator.infinite_orchestrator import InfiniteOrchestrator
     orchestrator = InfiniteOrchestrator()
     
     if args.simple:
@@ -208,4 +275,4 @@ async def handle_test_command(args):
     print("🧪 Infinite orchestrator test completed!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_event_loop(main())
\ No newline at end of file
@@ -6,32 +6,162 @@ Phase B: Structured AI communication
 Defines all JSON schemas for AI actors and tool interactions.
 """
 
+import copy
+import hashlib
 import json
-from typing import Dict, Any, List, Optional
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 
+# Fastest available JSON parser; all of them raise ValueError subclasses on bad input.
+# Declared once so the module type-checks (and compiles with mypyc) whichever is installed
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _orjson_loads  # type: ignore[import-not-found, unused-ignore]
+    _json_loads = _orjson_loads
+except ImportError:
+    try:
+        from ujson import loads as _ujson_loads  # type: ignore[import-untyped, import-not-found, unused-ignore]
+        _json_loads = _ujson_loads
+    except ImportError:
+        _json_loads = json.loads
+
+try:
+    import fastjsonschema  # type: ignore[import-untyped, import-not-found, unused-ignore]
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of validated responses remembered per SchemaValidator
+_RESULT_CACHE_SIZE = 512
+
+# Decodes an object in place from a given offset, no slicing or brace matching needed
+_json_decoder = json.JSONDecoder()
+
+# JSON code-block pattern, compiled once at import time
+_JSON_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+def _plan_defaults() -> Dict[str, Any]:
+    """Field defaults for plan responses (fresh containers per call)"""
+    return {
+        "plan": "",
+        "milestones": [],
+        "acceptance_tests": [],
+        "repo_layout": [],
+        "risks": []
+    }
+
+def _architecture_defaults() -> Dict[str, Any]:
+    """Field defaults for architecture responses (fresh containers per call)"""
+    return {
+        "pattern": "",
+        "components": [],
+        "interfaces": [],
+        "tech_stack": {},
+        "scaffold": []
+    }
+
+@dataclass(slots=True)
 class ToolCallSchema:
     """Schema for a tool call from AI"""
     name: str
     parameters: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class AIActorResponse:
     """Structured response from an AI actor"""
     reasoning: str
     tool_calls: List[ToolCallSchema]
     confidence: float = 1.0
-    next_steps: List[str] = None
+    next_steps: Tuple[str, ...] = ()
+
+# JSON schemas for every structured response, built once at import time
+_SCHEMAS = {
+    "tool_calling": {
+        "type": "object",
+        "properties": {
+            "reasoning": {"type": "string"},
+            "tool_calls": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "parameters": {"type": "object"}
+                    },
+                    "required": ["name", "parameters"]
+                }
+            }
+        },
+        "required": ["reasoning", "tool_calls"]
+    },
+    
+    "project_plan": {
+        "type": "object",
+        "properties": {
+            "plan": {"type": "string"},
+            "milestones": {
+                "type": "array",
+                "items": {"type": "string"}
+            },
+            "acceptance_tests": {
+                "type": "array", 
+                "items": {"type": "string"}
+            },
+            "repo_layout": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "path": {"type": "string"},
+                        "purpose": {"type": "string"}
+                    }
+                }
+            }
+        }
+    },
+    
+    "architecture": {
+        "type": "object",
+        "properties": {
+            "pattern": {"type": "string"},
+            "components": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "purpose": {"type": "string"},
+                        "responsibilities": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        }
+                    }
+                }
+            },
+            "tech_stack": {"type": "object"}
+        }
+    }
+}
 
 class SchemaValidator:
     """Validates AI responses against expected schemas"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.schemas = self._load_schemas()
+        
+        # LRU of validated results keyed by (response digest, expected format).
+        # Callers get deep copies, so they may mutate tool calls / milestones freely.
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        
+        # Generated validator functions per schema (empty without fastjsonschema)
+        self._compiled: Dict[str, Callable[[Any], Any]] = {}
+        if FASTJSONSCHEMA_AVAILABLE:
+            self._compiled = {name: fastjsonschema.compile(schema) for name, schema in self.schemas.items()}
     
     def validate_ai_response(self, response_text: str, expected_format: str = "tool_calling") -> Dict[str, Any]:
         """
@@ -44,9 +174,27 @@ class SchemaValidator:
         Returns:
             Parsed and validated response
         """
+        cache_key = (hashlib.blake2b(response_text.encode('utf-8'), digest_size=16).digest(), expected_format)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
+        result = self._validate_uncached(response_text, expected_format)
+        
+        if result["success"]:
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            return copy.deepcopy(result)
+        
+        return result
+    
+    def _validate_uncached(self, response_text: str, expected_format: str) -> Dict[str, Any]:
+        """Extract and validate JSON from a response (no caching)"""
         try:
-            # Try to extract JSON from response
-            json_data = self._extract_json(response_text)
+            # Cheap reject: no brace means no JSON, skip the regex/scanner entirely
+            json_data = self._extract_json(response_text) if "{" in response_text else None
             
             if json_data:
                 # Validate against schema
@@ -67,7 +215,9 @@ class SchemaValidator:
             }
             
         except Exception as e:
-            logger.error(f"📋 Schema validation error: {e}")
+            logger.error("📋 Schema validation error: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 Raw response: %s", response_text)
             return {
                 "success": False,
                 "error": str(e),
@@ -76,155 +226,85 @@ class SchemaValidator:
     
     def _extract_json(self, text: str) -> Optional[Dict[str, Any]]:
         """Extract JSON from AI response text"""
-        # Look for JSON blocks
-        import re
+        if "{" not in text:
+            return None
         
-        # Try to find JSON in code blocks
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        matches = re.findall(json_pattern, text, re.DOTALL)
-        
-        if matches:
+        # Try to find JSON in code blocks, stopping at the first one that parses
+        for match in _JSON_CODEBLOCK_RE.finditer(text):
             try:
-                return json.loads(matches[0])
-            except json.JSONDecodeError:
-                pass
-        
-        # Try to find JSON without code blocks
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        matches = re.findall(json_pattern, text, re.DOTALL)
+                return _json_loads(match.group(1))
+            except ValueError:
+                continue
         
-        for match in matches:
+        # Try to find JSON without code blocks: decode in place from each '{'
+        idx = text.find('{')
+        while idx != -1:
             try:
-                return json.loads(match)
-            except json.JSONDecodeError:
-                continue
+                return _json_decoder.raw_decode(text, idx)[0]
+            except ValueError:
+                idx = text.find('{', idx + 1)
         
         return None
     
     def _validate_tool_calling_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate tool calling response format"""
+        validate = self._compiled.get("tool_calling")
+        if validate is not None:
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaException:
+                pass  # Not strictly valid - salvage what we can below
+            else:
+                # Every tool call is known to be well-formed
+                return {
+                    "success": True,
+                    "type": "tool_calling",
+                    "reasoning": data["reasoning"],
+                    "tool_calls": [
+                        {"name": call["name"], "parameters": call["parameters"]}
+                        for call in data["tool_calls"]
+                    ]
+                }
+        
+        # Validate tool calls
+        tool_calls = data.get("tool_calls", [])
         result = {
             "success": True,
             "type": "tool_calling",
             "reasoning": data.get("reasoning", ""),
-            "tool_calls": []
+            "tool_calls": [
+                {"name": call["name"], "parameters": call["parameters"]}
+                for call in tool_calls
+                if isinstance(call, dict) and "name" in call and "parameters" in call
+            ]
         }
         
-        # Validate tool calls
-        tool_calls = data.get("tool_calls", [])
-        for call in tool_calls:
-            if isinstance(call, dict) and "name" in call and "parameters" in call:
-                result["tool_calls"].append({
-                    "name": call["name"],
-                    "parameters": call["parameters"]
-                })
-            else:
-                logger.warning(f"📋 Invalid tool call format: {call}")
+        # Only walk the list again for invalid entries when the warning would be emitted
+        if len(result["tool_calls"]) != len(tool_calls) and logger.isEnabledFor(logging.WARNING):
+            for call in tool_calls:
+                if not (isinstance(call, dict) and "name" in call and "parameters" in call):
+                    logger.warning("📋 Invalid tool call format: %s", call)
         
         return result
     
     def _validate_plan_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate project plan response"""
-        return {
-            "success": True,
-            "type": "plan",
-            "plan": data.get("plan", ""),
-            "milestones": data.get("milestones", []),
-            "acceptance_tests": data.get("acceptance_tests", []),
-            "repo_layout": data.get("repo_layout", []),
-            "risks": data.get("risks", [])
-        }
+        fields = _plan_defaults()
+        fields.update((key, data[key]) for key in fields.keys() & data.keys())
+        return {"success": True, "type": "plan", **fields}
     
     def _validate_architecture_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate architecture response"""
-        return {
-            "success": True,
-            "type": "architecture",
-            "pattern": data.get("pattern", ""),
-            "components": data.get("components", []),
-            "interfaces": data.get("interfaces", []),
-            "tech_stack": data.get("tech_stack", {}),
-            "scaffold": data.get("scaffold", [])
-        }
+        fields = _architecture_defaults()
+        fields.update((key, data[key]) for key in fields.keys() & data.keys())
+        return {"success": True, "type": "architecture", **fields}
     
     def _load_schemas(self) -> Dict[str, Dict[str, Any]]:
         """Load all JSON schemas"""
-        return {
-            "tool_calling": {
-                "type": "object",
-                "properties": {
-                    "reasoning": {"type": "string"},
-                    "tool_calls": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "parameters": {"type": "object"}
-                            },
-                            "required": ["name", "parameters"]
-                        }
-                    }
-                },
-                "required": ["reasoning", "tool_calls"]
-            },
-            
-            "project_plan": {
-                "type": "object",
-                "properties": {
-                    "plan": {"type": "string"},
-                    "milestones": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "acceptance_tests": {
-                        "type": "array", 
-                        "items": {"type": "string"}
-                    },
-                    "repo_layout": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "path": {"type": "string"},
-                                "purpose": {"type": "string"}
-                            }
-                        }
-                    }
-                }
-            },
-            
-            "architecture": {
-                "type": "object",
-                "properties": {
-                    "pattern": {"type": "string"},
-                    "components": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "purpose": {"type": "string"},
-                                "responsibilities": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                }
-                            }
-                        }
-                    },
-                    "tech_stack": {"type": "object"}
-                }
-            }
-        }
+        return _SCHEMAS
 
-# AI Actor Response Templates
-class ResponseTemplates:
-    """Templates for AI actor responses"""
-    
-    @staticmethod
-    def pm_response_template() -> str:
-        """Template for Project Manager responses"""
-        return """
+# AI Actor Response Templates (built once, shared by every prompt)
+_PM_TEMPLATE = """
 Analyze the requirements and create a comprehensive project plan.
 
 Respond in this JSON format:
@@ -264,11 +344,8 @@ Respond in this JSON format:
   ]
 }
 """
-    
-    @staticmethod
-    def architect_response_template() -> str:
-        """Template for Architect responses"""
-        return """
+
+_ARCHITECT_TEMPLATE = """
 Design the software architecture for this project.
 
 Respond in this JSON format:
@@ -306,11 +383,8 @@ Respond in this JSON format:
   ]
 }
 """
-    
-    @staticmethod
-    def coder_response_template() -> str:
-        """Template for Coder responses"""
-        return """
+
+_CODER_TEMPLATE = """
 Implement the requested functionality with clean, working code.
 
 Respond in this JSON format:
@@ -335,12 +409,33 @@ Respond in this JSON format:
 }
 """
 
+class ResponseTemplates:
+    """Templates for AI actor responses"""
+    
+    @staticmethod
+    def pm_response_template() -> str:
+        """Template for Project Manager responses"""
+        return _PM_TEMPLATE
+    
+    @staticmethod
+    def architect_response_template() -> str:
+        """Template for Architect responses"""
+        return _ARCHITECT_TEMPLATE
+    
+    @staticmethod
+    def coder_response_template() -> str:
+        """Template for Coder responses"""
+        return _CODER_TEMPLATE
+
+# Shared validator; reuse it rather than constructing one per request
+DEFAULT_VALIDATOR = SchemaValidator()
+
 # Test the schema validator
 def test_schema_validator():
     """Test the schema validator"""
     print("🧪 Testing Schema Validator...")
     
-    validator = SchemaValidator()
+    validator = DEFAULT_VALIDATOR
     
     # Test valid tool calling response
     valid_response = """
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🧠 Actor Batcher - Micro-batching for AI actor calls
+Groups actor calls that arrive close together and dispatches them as one batch
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from models.client import AIResponse, ModelClient
+
+logger = logging.getLogger(__name__)
+
+# How long the first call in a batch waits for company
+BATCH_WINDOW_SEC = 0.2
+
+# Dispatch immediately once this many calls are waiting
+MAX_BATCH_SIZE = 6
+
+class ActorBatcher:
+    """
+    Collects call_ai_actor requests for a short window and dispatches each
+    group together through ModelClient.call_batch.
+
+    Ollama's /api/generate takes one prompt per request, so a batch is sent as
+    concurrent requests over the shared session; the server's
+    OLLAMA_NUM_PARALLEL slots then decode them together.
+    """
+
+    def __init__(self, model_client: ModelClient, window: float = BATCH_WINDOW_SEC,
+                 max_batch_size: int = MAX_BATCH_SIZE):
+        self.model_client = model_client
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._dispatching: Set[asyncio.Task] = set()  # Keep dispatch tasks referenced until done
+
+    def submit(self, **spec) -> "asyncio.Future[AIResponse]":
+        """Queue a call_ai_actor call; the future resolves to its AIResponse"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((spec, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return future
+
+    def _flush(self):
+        """Dispatch everything that is waiting"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Run one batch and resolve its futures in order"""
+        logger.info(f"🧠 Dispatching {len(batch)} batched actor call(s)")
+
+        try:
+            responses = await self.model_client.call_batch([spec for spec, _ in batch])
+        except Exception as e:
+            responses = [AIResponse(success=False, content="", error=str(e)) for _ in batch]
+
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
@@ -7,21 +7,159 @@ This is where the magic happens - real AI actors working together!
 """
 
 import asyncio
+import glob
+import hashlib
+import os
+import re
+import stat
 import yaml
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Fastest available JSON parser; both raise ValueError subclasses on bad input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Import our Phase A foundation
 from .main import AutonomousOrchestrator, ProjectState, Phase
 from .direct_file_writer import DirectFileWriter
-from models.client import ModelClient, ModelConfig
-from models.schemas import SchemaValidator, ResponseTemplates
-from tools.repo_api import RepoService
+from .async_writer import AsyncArtifactWriter, is_critical
+from .actor_batcher import ActorBatcher
+from models.client import AIResponse, ModelClient, ModelConfig
+from models.schemas import DEFAULT_VALIDATOR, ResponseTemplates
+from tools.repo_api import DEFAULT_EXCLUDE_DIRS, RepoService
 from tools.sandbox import Sandbox
 
 logger = logging.getLogger(__name__)
 
+# A complete fenced code block: (info line, body)
+_FENCED_BLOCK_RE = re.compile(r'```([^\n]*)\n(.*?)\n```', re.DOTALL)
+
+# Debug probes for a coder response that could not be parsed
+_RESPONSE_PROBES_RE = re.compile(r'class|def|```')
+
+# `# path/to/file.py` marker on a fence's info line or first body line
+_FILE_MARKER_RE = re.compile(r'#\s*([\w./-]+\.py)\s*$')
+
+def _file_from_fenced_block(info: str, body: str) -> Optional[Dict[str, str]]:
+    """Turn a fenced block into a file spec if it names its target path"""
+    marker = _FILE_MARKER_RE.search(info)
+    if marker:
+        return {"path": marker.group(1), "content": body.strip()}
+    
+    first_line, _, rest = body.partition("\n")
+    marker = _FILE_MARKER_RE.match(first_line.strip())
+    if marker:
+        return {"path": marker.group(1), "content": rest.strip()}
+    
+    return None
+
+# Total characters of file snippets shipped in one prompt; later files are listed by name only
+_PROMPT_FILES_BUDGET = 20000
+
+# Actor responses remembered (LRU); every new project state adds entries
+_RESP_CACHE_SIZE = 128
+
+# Static planning instructions appended to every PM prompt
+_PM_RUBRIC = """
+Focus on:
+1. Breaking down requirements into clear milestones
+2. Defining specific acceptance tests
+3. Creating logical file structure
+4. Identifying potential risks
+5. Setting realistic scope
+
+Create the initial project structure using repo_write tool calls.
+"""
+
+# Static design instructions appended to every Architect prompt
+_ARCHITECT_RUBRIC = """
+Consider:
+1. Appropriate architectural patterns
+2. Module boundaries and interfaces
+3. Technology stack selection
+4. Scalability and maintainability
+5. Testing strategy
+
+Create scaffolding files using repo_write tool calls.
+"""
+
+# Static coding rubric appended to every Coder prompt
+_CODER_RUBRIC = """
+CRITICAL: Create RUNNABLE applications, not just function definitions!
+
+Requirements for ALL code:
+1. Include a main() function that demonstrates the functionality
+2. Add if __name__ == "__main__": main() at the end
+3. Create interactive CLI interfaces where appropriate
+4. Make the program actually DO something when run
+5. Include example usage and clear output
+6. Add ROBUST error handling and user feedback
+7. Create complete, working applications that users can run immediately
+
+CRITICAL ERROR HANDLING REQUIREMENTS:
+- Validate ALL user inputs with try/catch blocks
+- Handle invalid inputs gracefully (don't crash!)
+- Provide helpful error messages and retry options
+- Use input validation loops that keep asking until valid input
+- Handle edge cases like empty input, wrong types, out of range values
+- Never let the program crash from user input errors
+- Always provide fallback defaults or retry mechanisms
+
+Example structure:
+```python
+def main_functionality():
+    # Core logic here
+    pass
+
+def main():
+    print("Welcome to [App Name]!")
+    # Interactive interface or demo
+    # Show the functionality working
+    print("Example usage:")
+    # Demonstrate with real examples
+    
+if __name__ == "__main__":
+    main()
+```
+
+Use repo_write to create/update implementation files. Write production-ready, EXECUTABLE code.
+
+CRITICAL FILE NAMING AND STRUCTURE REQUIREMENTS:
+- Use meaningful, descriptive file names (NOT generic names like "generated_code_1.py")
+- Create proper directory structures for complex projects
+- Use this format: "File: path/filename.py" or "# path/filename.py" before code blocks
+- IMPORTANT: When creating files in subfolders, ensure imports work correctly:
+  * Use relative imports: from .database.models import User
+  * Or absolute imports: from api.auth import authenticate
+  * Create __init__.py files in directories to make them Python packages
+  * In main.py, use: from api.auth import login, from database.models import User
+- Examples:
+  * main.py (entry point)
+  * api/auth.py (authentication API)
+  * api/users.py (user management API)
+  * database/models.py (data models)
+  * database/connection.py (database setup)
+  * services/user_service.py (business logic)
+  * utils/helpers.py (utility functions)
+  * config/settings.py (configuration)
+  * tests/test_auth.py (authentication tests)
+  * frontend/app.py (frontend application)
+  * static/style.css (CSS files)
+  * templates/index.html (HTML templates)
+"""
+
 class AIOrchestrator(AutonomousOrchestrator):
     """
     Enhanced orchestrator with real AI integration.
@@ -39,14 +177,36 @@ class AIOrchestrator(AutonomousOrchestrator):
         model_config = ModelConfig(
             host=self.policies.get("model", {}).get("host", "http://localhost:11434"),
             model_name=self.policies.get("model", {}).get("name", "qwen3-coder:30b-a3b-q4_K_M"),
-            timeout=self.policies.get("model", {}).get("timeout", 300)
+            timeout=self.policies.get("model", {}).get("timeout", 300),
+            num_parallel=int(os.environ.get(
+                "OLLAMA_NUM_PARALLEL",
+                self.policies.get("model", {}).get("num_parallel", 4)
+            )),
+            keep_alive=self.policies.get("model", {}).get("keep_alive")
         )
         
         self.model_client = ModelClient(model_config)
-        self.schema_validator = SchemaValidator()
+        self.batcher = ActorBatcher(self.model_client)  # Groups actor calls issued close together
+        self.schema_validator = DEFAULT_VALIDATOR
+        
+        # Architect response fetched concurrently with the PM plan, consumed by _phase_architect
+        self._prefetched_architect: Optional[AIResponse] = None
+        
+        # Successful actor responses keyed by role + requirements + project file state (LRU);
+        # callers always get their own copy, since AIResponse is mutable
+        self._resp_cache: "OrderedDict[str, AIResponse]" = OrderedDict()
+        
+        # Project file contents keyed by relative path -> (mtime_ns, content)
+        self._file_cache: Dict[str, Tuple[int, str]] = {}
+        
+        # Project digest at the last AI verification, for the tests-pass fast path
+        self._last_verify_files_hash: Optional[str] = None
         
         # Initialize direct file writer (replaces broken tool bus)
         self.file_writer = None  # Will be initialized when project starts
+        self.artifact_writer: Optional[AsyncArtifactWriter] = None  # Background writes for non-critical files
+        self._repo_service: Optional[RepoService] = None  # Opened once per project path
+        self._sandbox: Optional[Sandbox] = None  # Shared so its pooled containers outlive a phase
         
         logger.info("🤖 AI Orchestrator initialized with 30B model integration")
     
@@ -54,7 +214,7 @@ class AIOrchestrator(AutonomousOrchestrator):
         """Load policies from YAML file"""
         try:
             with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             logger.warning(f"🤖 Could not load policies: {e}, using defaults")
             return {}
@@ -65,40 +225,14 @@ class AIOrchestrator(AutonomousOrchestrator):
         """Project Manager creates plan using AI"""
         logger.info("📋 AI Project Manager analyzing requirements...")
         
-        # Prepare context for PM
-        context = {
-            "requirements": self.state.requirements,
-            "project_path": self.state.project_path,
-            "complexity": self._assess_complexity()
-        }
-        
-        # No tools needed for PM - just planning
-        tools = None
-        
-        # Call PM AI actor
-        pm_prompt = f"""
-Analyze these requirements and create a comprehensive project plan:
-
-REQUIREMENTS: {self.state.requirements}
-
-{ResponseTemplates.pm_response_template()}
-
-Focus on:
-1. Breaking down requirements into clear milestones
-2. Defining specific acceptance tests
-3. Creating logical file structure
-4. Identifying potential risks
-5. Setting realistic scope
-
-Create the initial project structure using repo_write tool calls.
-"""
-        
-        response = await self.model_client.call_ai_actor(
-            role="pm",
-            user_message=pm_prompt,
-            context=context,
-            tools=tools
-        )
+        # Design alongside the plan; the tests don't exist yet, so this architect
+        # prompt works from the requirements alone
+        response, architect_response = await self._fanout_actors([
+            self._pm_spec(),
+            self._architect_spec(with_tests=False)
+        ])
+        if architect_response.success:
+            self._prefetched_architect = architect_response
         
         if response.success:
             # Parse and validate response
@@ -125,43 +259,37 @@ Create the initial project structure using repo_write tool calls.
             self.state.acceptance_tests = ["Application runs without errors"]
             self.state.phase = Phase.ARCHITECT
     
-    async def _phase_architect(self):
-        """Architect designs system using AI"""
-        logger.info("🏗️ AI Architect designing system architecture...")
-        
+    def _pm_spec(self) -> Dict[str, Any]:
+        """Build the call_ai_actor arguments for the Project Manager"""
+        # Prepare context for PM
         context = {
             "requirements": self.state.requirements,
-            "acceptance_tests": self.state.acceptance_tests,
-            "project_path": self.state.project_path
+            "project_path": self.state.project_path,
+            "complexity": self._assess_complexity()
         }
         
-        # No tools needed for Architect - just design
+        # No tools needed for PM - just planning
         tools = None
         
-        architect_prompt = f"""
-Design the software architecture for this project:
+        pm_prompt = f"""
+Analyze these requirements and create a comprehensive project plan:
 
 REQUIREMENTS: {self.state.requirements}
-ACCEPTANCE TESTS: {self.state.acceptance_tests}
-
-{ResponseTemplates.architect_response_template()}
 
-Consider:
-1. Appropriate architectural patterns
-2. Module boundaries and interfaces
-3. Technology stack selection
-4. Scalability and maintainability
-5. Testing strategy
-
-Create scaffolding files using repo_write tool calls.
-"""
+{ResponseTemplates.pm_response_template()}
+""" + _PM_RUBRIC
         
-        response = await self.model_client.call_ai_actor(
-            role="architect",
-            user_message=architect_prompt,
-            context=context,
-            tools=tools
-        )
+        return {"role": "pm", "user_message": pm_prompt, "context": context, "tools": tools}
+    
+    async def _phase_architect(self):
+        """Architect designs system using AI"""
+        logger.info("🏗️ AI Architect designing system architecture...")
+        
+        # Reuse the design produced alongside the plan, if there is one
+        response = self._prefetched_architect
+        self._prefetched_architect = None
+        if response is None:
+            response = await self._call_actor_cached(**self._architect_spec())
         
         if response.success:
             parsed = self.schema_validator.validate_ai_response(response.content, "architecture")
@@ -184,13 +312,36 @@ Create scaffolding files using repo_write tool calls.
             logger.error(f"🏗️ Architect AI call failed: {response.error}")
             self.state.phase = Phase.CODE_WRITE
     
+    def _architect_spec(self, with_tests: bool = True) -> Dict[str, Any]:
+        """Build the call_ai_actor arguments for the Architect (without the PM's tests when prefetched)"""
+        context = {
+            "requirements": self.state.requirements,
+            "project_path": self.state.project_path
+        }
+        tests_line = ""
+        if with_tests:
+            context["acceptance_tests"] = self.state.acceptance_tests
+            tests_line = f"ACCEPTANCE TESTS: {self.state.acceptance_tests}\n"
+        
+        # No tools needed for Architect - just design
+        tools = None
+        
+        architect_prompt = f"""
+Design the software architecture for this project:
+
+REQUIREMENTS: {self.state.requirements}
+{tests_line}
+{ResponseTemplates.architect_response_template()}
+""" + _ARCHITECT_RUBRIC
+        
+        return {"role": "architect", "user_message": architect_prompt, "context": context, "tools": tools}
+    
     async def _phase_code_write(self):
         """Coder writes the actual implementation using AI"""
         logger.info("💻 AI Coder writing implementation...")
         
         # Read current project files
-        repo = RepoService(self.state.project_path)
-        files = repo.read_files(["**/*.py", "**/*.js", "**/*.ts"])
+        files = await self._read_project_files(["**/*.py", "**/*.js", "**/*.ts"])
         
         context = {
             "requirements": self.state.requirements,
@@ -209,112 +360,62 @@ ACCEPTANCE TESTS: {self.state.acceptance_tests}
 
 EXISTING FILES:
 {self._format_files_for_prompt(files.get("files", {}))}
-
-CRITICAL: Create RUNNABLE applications, not just function definitions!
-
-Requirements for ALL code:
-1. Include a main() function that demonstrates the functionality
-2. Add if __name__ == "__main__": main() at the end
-3. Create interactive CLI interfaces where appropriate
-4. Make the program actually DO something when run
-5. Include example usage and clear output
-6. Add ROBUST error handling and user feedback
-7. Create complete, working applications that users can run immediately
-
-CRITICAL ERROR HANDLING REQUIREMENTS:
-- Validate ALL user inputs with try/catch blocks
-- Handle invalid inputs gracefully (don't crash!)
-- Provide helpful error messages and retry options
-- Use input validation loops that keep asking until valid input
-- Handle edge cases like empty input, wrong types, out of range values
-- Never let the program crash from user input errors
-- Always provide fallback defaults or retry mechanisms
-
-Example structure:
-```python
-def main_functionality():
-    # Core logic here
-    pass
-
-def main():
-    print("Welcome to [App Name]!")
-    # Interactive interface or demo
-    # Show the functionality working
-    print("Example usage:")
-    # Demonstrate with real examples
-    
-if __name__ == "__main__":
-    main()
-```
-
-Use repo_write to create/update implementation files. Write production-ready, EXECUTABLE code.
-
-CRITICAL FILE NAMING AND STRUCTURE REQUIREMENTS:
-- Use meaningful, descriptive file names (NOT generic names like "generated_code_1.py")
-- Create proper directory structures for complex projects
-- Use this format: "File: path/filename.py" or "# path/filename.py" before code blocks
-- IMPORTANT: When creating files in subfolders, ensure imports work correctly:
-  * Use relative imports: from .database.models import User
-  * Or absolute imports: from api.auth import authenticate
-  * Create __init__.py files in directories to make them Python packages
-  * In main.py, use: from api.auth import login, from database.models import User
-- Examples:
-  * main.py (entry point)
-  * api/auth.py (authentication API)
-  * api/users.py (user management API)
-  * database/models.py (data models)
-  * database/connection.py (database setup)
-  * services/user_service.py (business logic)
-  * utils/helpers.py (utility functions)
-  * config/settings.py (configuration)
-  * tests/test_auth.py (authentication tests)
-  * frontend/app.py (frontend application)
-  * static/style.css (CSS files)
-  * templates/index.html (HTML templates)
-"""
+""" + _CODER_RUBRIC
         
-        response = await self.model_client.call_ai_actor(
+        # Files are written as their code blocks close, while the model keeps generating
+        response, streamed_files, remaining = await self._stream_coder_response(
             role="coder",
             user_message=code_prompt,
             context=context,
             tools=tools
         )
+        if streamed_files:
+            logger.info(f"💻 Coder streamed {len(streamed_files)} files: {streamed_files}")
         
-        if response.success:
+        # Anything not written during streaming still goes through the normal parser
+        if response.success and (not streamed_files or "```" in remaining):
+            content = remaining
+            
             # Initialize file writer if not done yet
-            if not self.file_writer:
-                self.file_writer = DirectFileWriter(self.state.project_path)
+            writer = self._get_artifact_writer()
             
             # SKIP BROKEN SCHEMA VALIDATOR - Use direct parsing always
             logger.info("💻 Using direct response parsing (schema validator bypassed)")
             
             # Always use direct parsing since schema validator is broken
-            result = self.file_writer.parse_ai_response_and_write(
-                response.content, 
+            result = await asyncio.to_thread(
+                writer.run_locked,
+                self.file_writer.parse_ai_response_and_write,
+                content, 
                 "AI Coder implementation"
             )
             if result["success"]:
                 logger.info(f"💻 Coder created {len(result.get('files_created', []))} files")
             else:
                 # Try old method as backup
-                parsed = self.schema_validator.validate_ai_response(response.content)
+                parsed = self.schema_validator.validate_ai_response(content)
                 if parsed["success"] and "tool_calls" in parsed:
                     await self._execute_tool_calls(parsed["tool_calls"])
                 logger.info("💻 Using direct response parsing for file creation")
-                logger.info(f"🔍 DEBUG: AI Response preview: {response.content[:200]}...")
-                logger.info(f"🔍 DEBUG: Response contains 'class': {'class' in response.content}")
-                logger.info(f"🔍 DEBUG: Response contains 'def': {'def' in response.content}")
-                logger.info(f"🔍 DEBUG: Response contains code blocks: {'```' in response.content}")
+                logger.info(f"🔍 DEBUG: AI Response preview: {content[:200]}...")
+                if logger.isEnabledFor(logging.DEBUG):
+                    # One scan of the response for all three probes
+                    found = {match.group() for match in _RESPONSE_PROBES_RE.finditer(content)}
+                    logger.debug(f"🔍 DEBUG: Response contains 'class': {'class' in found}")
+                    logger.debug(f"🔍 DEBUG: Response contains 'def': {'def' in found}")
+                    logger.debug(f"🔍 DEBUG: Response contains code blocks: {'```' in found}")
                 
-                result = self.file_writer.parse_ai_response_and_write(
-                    response.content, 
+                result = await asyncio.to_thread(
+                    writer.run_locked,
+                    self.file_writer.parse_ai_response_and_write,
+                    content, 
                     "AI Coder implementation"
                 )
                 if result["success"]:
                     logger.info(f"💻 Coder created {len(result.get('files_created', []))} files")
                 else:
                     logger.warning(f"💻 Direct parsing failed: {result.get('error')}")
-                    logger.warning(f"🔍 DEBUG: Full AI response: {response.content}")
+                    logger.warning(f"🔍 DEBUG: Full AI response: {content}")
             
         self.state.phase = Phase.TEST_WRITE
     
@@ -323,8 +424,7 @@ CRITICAL FILE NAMING AND STRUCTURE REQUIREMENTS:
         logger.info("🧪 AI Test Engineer writing comprehensive tests...")
         
         # Read current project files
-        repo = RepoService(self.state.project_path)
-        files = repo.read_files(["**/*.py", "**/*.js", "**/*.ts"])
+        files = await self._read_project_files(["**/*.py", "**/*.js", "**/*.ts"])
         
         context = {
             "requirements": self.state.requirements,
@@ -353,7 +453,7 @@ Create:
 Use repo_write to create test files. Follow testing best practices.
 """
         
-        response = await self.model_client.call_ai_actor(
+        response = await self.batcher.submit(
             role="test_engineer",
             user_message=test_prompt,
             context=context,
@@ -373,21 +473,24 @@ Use repo_write to create test files. Follow testing best practices.
         """Run tests and static analysis using sandbox"""
         logger.info("🚀 Running tests and static analysis...")
         
+        # Tests must see every queued file
+        await self._flush_artifact_writes()
+        
         # Initialize sandbox and repo
-        sandbox = Sandbox()
+        sandbox = self._get_sandbox()
         
         # Install dependencies first
         install_result = await sandbox.install_dependencies(self.state.project_path)
         if not install_result.success:
             logger.warning(f"🚀 Dependency installation failed: {install_result.stderr}")
         
-        # Run tests
-        test_result = await sandbox.run_tests(self.state.project_path, self.state.test_cmd)
-        
-        # Run static analysis
-        analysis_results = await sandbox.run_static_analysis(
-            self.state.project_path, 
-            ["**/*.py"]
+        # Tests and static analysis are independent - run them side by side
+        test_result, analysis_results = await asyncio.gather(
+            sandbox.run_tests(self.state.project_path, self.state.test_cmd),
+            sandbox.run_static_analysis(
+                self.state.project_path, 
+                ["**/*.py"]
+            )
         )
         
         # Check results
@@ -407,9 +510,12 @@ Use repo_write to create test files. Follow testing best practices.
         """Debugger analyzes failures using AI"""
         logger.info("🔍 AI Debugger analyzing failures...")
         
-        # Get current diff
-        repo = RepoService(self.state.project_path)
-        current_diff = repo.get_diff()
+        await self._flush_artifact_writes()
+        
+        # Get current diff (git work happens off the event loop)
+        current_diff = await asyncio.to_thread(
+            lambda: self._get_repo_service().get_diff()
+        )
         
         context = {
             "failure_logs": self.state.last_logs,
@@ -438,7 +544,7 @@ Identify:
 Use repo_write to apply fixes. Keep changes minimal and focused.
 """
         
-        response = await self.model_client.call_ai_actor(
+        response = await self.batcher.submit(
             role="debugger",
             user_message=debug_prompt,
             context=context,
@@ -458,7 +564,8 @@ Use repo_write to apply fixes. Keep changes minimal and focused.
         """Test fixes and continue or loop back"""
         logger.info("🔧 Testing repairs...")
         
-        sandbox = Sandbox()
+        await self._flush_artifact_writes()
+        sandbox = self._get_sandbox()
         test_result = await sandbox.run_tests(self.state.project_path, self.state.test_cmd)
         
         if test_result.success:
@@ -473,18 +580,25 @@ Use repo_write to apply fixes. Keep changes minimal and focused.
         """Verifier checks completion using AI"""
         logger.info("✅ AI Verifier checking completion...")
         
-        # Get final project state
-        repo = RepoService(self.state.project_path)
-        files = repo.read_files(["**/*"])
+        await self._flush_artifact_writes()
         
-        sandbox = Sandbox()
+        sandbox = self._get_sandbox()
         final_test_result = await sandbox.run_tests(self.state.project_path)
         
+        # Final project state - only the digest and file count are needed, not contents.
+        # Tests pass and the verifier already reviewed this exact tree - nothing new to ask
+        files_digest, file_count = await asyncio.to_thread(self._scan_project_files)
+        if final_test_result.success and files_digest == self._last_verify_files_hash:
+            logger.info("✅ Tests pass and project unchanged since last verification - done")
+            self.state.phase = Phase.DONE
+            return
+        self._last_verify_files_hash = files_digest
+        
         context = {
             "requirements": self.state.requirements,
             "acceptance_tests": self.state.acceptance_tests,
             "final_test_result": final_test_result.stdout,
-            "project_files": len(files.get("files", {}))
+            "project_files": file_count
         }
         
         verify_prompt = f"""
@@ -497,7 +611,7 @@ FINAL TEST RESULTS:
 {final_test_result.stdout}
 
 PROJECT STATUS:
-- Files created: {len(files.get("files", {}))}
+- Files created: {file_count}
 - Tests passing: {final_test_result.success}
 
 Decide: Is the project complete and working? If not, what needs to be done?
@@ -510,7 +624,9 @@ Respond with JSON:
 }}
 """
         
-        response = await self.model_client.call_ai_actor(
+        # The prompt carries the test output; key on its outcome, not its timings
+        response = await self._call_actor_cached(
+            cache_extra=f"tests_passed={final_test_result.success}",
             role="verifier",
             user_message=verify_prompt,
             context=context
@@ -519,15 +635,14 @@ Respond with JSON:
         if response.success:
             # Try to parse decision
             try:
-                import json
-                decision = json.loads(response.content)
+                decision = _json_loads(response.content)
                 if decision.get("complete", False):
                     logger.info("✅ Verifier approved completion!")
                     self.state.phase = Phase.DONE
                 else:
                     logger.info("✅ Verifier requests more work")
                     self.state.phase = Phase.TEST_WRITE  # Continue iteration
-            except:
+            except (ValueError, AttributeError):
                 # Fallback decision
                 if final_test_result.success:
                     self.state.phase = Phase.DONE
@@ -542,11 +657,261 @@ Respond with JSON:
     
     # Helper methods
     
+    async def _fanout_actors(self, specs: List[Dict[str, Any]]) -> List[AIResponse]:
+        """Run independent AI actor calls concurrently, results in spec order"""
+        files_digest = await asyncio.to_thread(self._project_files_digest)
+        keys = [self._response_cache_key(spec["role"], files_digest) for spec in specs]
+        responses = [self._cached_response(key) for key in keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        
+        if misses:
+            # A failing call becomes an unsuccessful AIResponse instead of cancelling the rest
+            fresh = await asyncio.gather(*(self.batcher.submit(**specs[i]) for i in misses))
+            for i, response in zip(misses, fresh):
+                responses[i] = response
+                if response.success:
+                    self._cache_response(keys[i], response)
+        
+        return responses
+    
+    async def _call_actor_cached(self, cache_extra: str = "", **spec) -> AIResponse:
+        """
+        Call an AI actor, reusing the last answer when nothing it depends on changed.
+        
+        cache_extra adds prompt inputs beyond the requirements and files to the key.
+        """
+        files_digest = await asyncio.to_thread(self._project_files_digest)
+        key = self._response_cache_key(spec["role"], files_digest, cache_extra)
+        cached = self._cached_response(key)
+        if cached is not None:
+            logger.info(f"🧠 Reusing cached {spec['role']} response (project unchanged)")
+            return cached
+        
+        response = await self.batcher.submit(**spec)
+        if response.success:
+            self._cache_response(key, response)
+        return response
+    
+    def _cached_response(self, key: str) -> Optional[AIResponse]:
+        """A copy of the cached response for a key, marked as recently used"""
+        cached = self._resp_cache.get(key)
+        if cached is None:
+            return None
+        self._resp_cache.move_to_end(key)
+        return replace(cached)
+    
+    def _cache_response(self, key: str, response: AIResponse):
+        """Remember a copy of a response, evicting the least recently used past the limit"""
+        self._resp_cache[key] = replace(response)
+        self._resp_cache.move_to_end(key)
+        while len(self._resp_cache) > _RESP_CACHE_SIZE:
+            self._resp_cache.popitem(last=False)
+    
+    def _response_cache_key(self, role: str, files_digest: str, extra: str = "") -> str:
+        """Content-address an actor call by role, requirements, project file state and any extra inputs"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(role.encode())
+        digest.update(b"|")
+        digest.update(self.state.requirements.encode())
+        digest.update(b"|")
+        digest.update(repr(self.state.acceptance_tests).encode())
+        digest.update(b"|")
+        digest.update(files_digest.encode())
+        if extra:
+            digest.update(b"|")
+            digest.update(extra.encode())
+        return digest.hexdigest()
+    
+    async def _stream_coder_response(self, **spec) -> Tuple[AIResponse, List[str], str]:
+        """
+        Stream an actor's answer, writing each fenced block tagged with a
+        `# path.py` marker as soon as it closes.
+        
+        Returns the full response, the files already written and the text that
+        was not consumed (untagged blocks and prose) for the regular parser.
+        Streamed files are committed together once the stream ends.
+        """
+        writer = self._get_artifact_writer()
+        parts: List[str] = []
+        leftover: List[str] = []
+        writes = []
+        pending = ""
+        
+        try:
+            async for text in self.model_client.stream_ai_actor(**spec):
+                parts.append(text)
+                pending += text
+                if "`" not in text:
+                    continue  # No fence can have closed
+                
+                match = _FENCED_BLOCK_RE.search(pending)
+                while match:
+                    file = _file_from_fenced_block(match.group(1), match.group(2))
+                    if file is None:
+                        leftover.append(pending[:match.end()])
+                    else:
+                        leftover.append(pending[:match.start()])
+                        writes.append(asyncio.create_task(asyncio.to_thread(
+                            writer.write_now, [file], "AI Coder implementation", True
+                        )))
+                    pending = pending[match.end():]
+                    match = _FENCED_BLOCK_RE.search(pending)
+        except Exception as e:
+            logger.warning(f"💻 Streaming {spec['role']} failed ({e}), retrying without streaming")
+            await asyncio.gather(*writes, return_exceptions=True)
+            if writes:
+                await asyncio.to_thread(writer.run_locked, self.file_writer.commit_pending)
+            response = await self.model_client.call_ai_actor(**spec)
+            return response, [], response.content
+        
+        written = []
+        for result in await asyncio.gather(*writes, return_exceptions=True):
+            if isinstance(result, dict) and result.get("success"):
+                written.extend(result["files_created"])
+            else:
+                logger.error(f"💻 Streamed file write failed: {result if isinstance(result, BaseException) else result.get('error')}")
+        
+        # One commit for the whole stream instead of one per block
+        if writes:
+            await asyncio.to_thread(writer.run_locked, self.file_writer.commit_pending)
+        
+        leftover.append(pending)
+        response = AIResponse(success=True, content="".join(parts))
+        return response, written, "".join(leftover)
+    
+    def _get_artifact_writer(self) -> AsyncArtifactWriter:
+        """Get the background writer, creating the direct file writer on first use"""
+        if not self.file_writer:
+            self.file_writer = DirectFileWriter(
+                self.state.project_path,
+                write_concurrency=int(self.policies.get("io", {}).get("write_concurrency", 4)),
+                parallel_installs=bool(self.policies.get("io", {}).get("parallel_installs", False)),
+                defer_commits=bool(self.policies.get("io", {}).get("defer_commits", False))
+            )
+        if self.artifact_writer is None or self.artifact_writer.file_writer is not self.file_writer:
+            if self.artifact_writer is not None:
+                self.artifact_writer.close()  # Land the previous project's queued writes first
+            self.artifact_writer = AsyncArtifactWriter(self.file_writer)
+        return self.artifact_writer
+    
+    def _get_repo_service(self) -> RepoService:
+        """RepoService for the current project, reopened only when the project path changes"""
+        if self._repo_service is None or self._repo_service.repo_path != Path(self.state.project_path):
+            self._repo_service = RepoService(self.state.project_path)
+        return self._repo_service
+    
+    def _get_sandbox(self) -> Sandbox:
+        """Sandbox shared by every phase, so its pooled Docker containers are reused"""
+        if self._sandbox is None:
+            self._sandbox = Sandbox()
+        return self._sandbox
+    
+    async def aclose(self):
+        """Flush background writes, then release the sandbox and the model client; call once the run is over"""
+        try:
+            if self.artifact_writer is not None:
+                await self._flush_artifact_writes()
+                await asyncio.to_thread(self.artifact_writer.close)
+                self.artifact_writer = None
+        finally:
+            try:
+                if self._sandbox is not None:
+                    await self._sandbox.aclose()
+                    self._sandbox = None
+            finally:
+                await self.model_client.aclose()
+    
+    async def _flush_artifact_writes(self):
+        """Wait for queued background writes to land on disk, then commit any deferred ones"""
+        if self.artifact_writer is not None:
+            await asyncio.to_thread(self.artifact_writer.join)
+            if self.file_writer.defer_commits:
+                await asyncio.to_thread(self.artifact_writer.run_locked, self.file_writer.commit_pending)
+    
+    async def _read_project_files(self, patterns: List[str]) -> Dict[str, Any]:
+        """Flush pending writes, then read project files off the event loop"""
+        await self._flush_artifact_writes()
+        return await asyncio.to_thread(self._cached_read_files, patterns)
+    
+    def _cached_read_files(self, patterns: List[str], max_bytes: int = 200000) -> Dict[str, Any]:
+        """
+        Read project files like RepoService.read_files, serving unchanged files from memory.
+        
+        Files under DEFAULT_EXCLUDE_DIRS (virtualenvs, build output, caches) are skipped.
+        """
+        root = self.state.project_path
+        files = {}
+        
+        for pattern in patterns:
+            for full_path in glob.glob(os.path.join(root, pattern), recursive=True):
+                rel_path = os.path.relpath(full_path, root)
+                if rel_path in files or not DEFAULT_EXCLUDE_DIRS.isdisjoint(rel_path.split(os.sep)[:-1]):
+                    continue
+                
+                try:
+                    st = os.stat(full_path)
+                    if not stat.S_ISREG(st.st_mode):
+                        continue
+                    
+                    cached = self._file_cache.get(rel_path)
+                    if cached is None or cached[0] != st.st_mtime_ns:
+                        with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+                            content = f.read()
+                        if len(content.encode('utf-8')) > max_bytes:
+                            content = content[:max_bytes] + "\n... [TRUNCATED]"
+                        cached = (st.st_mtime_ns, content)
+                        self._file_cache[rel_path] = cached
+                except OSError as e:
+                    logger.error(f"📁 Error reading {rel_path}: {e}")
+                    files[rel_path] = {"error": str(e)}
+                    continue
+                
+                files[rel_path] = {
+                    "content": cached[1],
+                    "size": st.st_size,
+                    "modified": st.st_mtime
+                }
+        
+        return {"files": files, "total_files": len(files)}
+    
+    def _project_files_digest(self) -> str:
+        """Digest of the project tree (see _scan_project_files)"""
+        return self._scan_project_files()[0]
+    
+    def _scan_project_files(self) -> Tuple[str, int]:
+        """
+        Digest and count project files from names, sizes and mtimes.
+        
+        DEFAULT_EXCLUDE_DIRS and hidden entries are skipped, so installs, test
+        caches and .autopilot state change neither the digest nor the count.
+        """
+        root = self.state.project_path
+        entries = []
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.name.startswith('.') or entry.name in DEFAULT_EXCLUDE_DIRS:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                            entries.append(f"{rel_path}:{st.st_size}:{st.st_mtime_ns}")
+            except OSError:
+                continue
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for line in sorted(entries):
+            digest.update(line.encode() + b"\n")
+        return digest.hexdigest(), len(entries)
+    
     async def _execute_tool_calls(self, tool_calls: list):
         """Execute tool calls using direct file writer"""
         # Initialize file writer if not done yet
-        if not self.file_writer:
-            self.file_writer = DirectFileWriter(self.state.project_path)
+        writer = self._get_artifact_writer()
         
         logger.info(f"🔍 DEBUG: Executing {len(tool_calls)} tool calls")
         logger.info(f"🔍 DEBUG: Tool calls: {tool_calls}")
@@ -567,11 +932,24 @@ Respond with JSON:
                         })
                 
                 if files:
-                    result = self.file_writer.write_multiple_files(files, message)
-                    if result["success"]:
-                        logger.info(f"🔧 Created {len(result['files_created'])} files: {result['files_created']}")
-                    else:
-                        logger.error(f"🔧 File creation failed: {result.get('error')}")
+                    for file in files:
+                        self._file_cache.pop(os.path.normpath(file["path"]), None)
+                    self._resp_cache.clear()  # Project changed - cached answers are stale
+                    
+                    # Entry points and configs land now; modules and tests are written in the background
+                    critical = [file for file in files if is_critical(file["path"])]
+                    buffered = [file for file in files if not is_critical(file["path"])]
+                    
+                    if buffered:
+                        writer.submit(buffered, message)
+                        logger.info(f"🔧 Queued {len(buffered)} files for background write")
+                    
+                    if critical:
+                        result = await asyncio.to_thread(writer.write_now, critical, message)
+                        if result["success"]:
+                            logger.info(f"🔧 Created {len(result['files_created'])} files: {result['files_created']}")
+                        else:
+                            logger.error(f"🔧 File creation failed: {result.get('error')}")
                 else:
                     logger.warning(f"🔧 No valid files to create in tool call")
             else:
@@ -591,10 +969,24 @@ Respond with JSON:
     def _format_files_for_prompt(self, files: Dict[str, Any]) -> str:
         """Format files for AI prompt"""
         formatted = []
+        first_seen: Dict[str, str] = {}  # snippet -> first path that showed it
+        budget = _PROMPT_FILES_BUDGET
+        
         for path, file_data in files.items():
             if isinstance(file_data, dict) and "content" in file_data:
                 content = file_data["content"][:500]  # Truncate for prompt
-                formatted.append(f"=== {path} ===\n{content}\n")
+                
+                if not content.strip():
+                    formatted.append(f"=== {path} === (empty)\n")
+                elif content in first_seen:
+                    formatted.append(f"=== {path} === (same as {first_seen[content]})\n")
+                elif len(content) > budget:
+                    formatted.append(f"=== {path} === ({file_data.get('size', len(content))} bytes, omitted)\n")
+                else:
+                    first_seen[content] = path
+                    budget -= len(content)
+                    formatted.append(f"=== {path} ===\n{content}\n")
+        
         return "\n".join(formatted)
     
     def _format_failure_logs(self, test_result, analysis_results) -> str:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+📝 Async Artifact Writer - Background writes for non-critical files
+Lets the next model call start while generated modules and tests hit the disk
+"""
+
+import logging
+import queue
+import threading
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, List, Optional
+
+from .direct_file_writer import DirectFileWriter
+
+logger = logging.getLogger(__name__)
+
+# Files that must be on disk before the orchestrator moves on
+CRITICAL_FILE_NAMES = frozenset({
+    "main.py", "requirements.txt", "setup.py", "pyproject.toml", "setup.cfg"
+})
+
+# Config formats are written synchronously too
+CRITICAL_SUFFIXES = frozenset({".yaml", ".yml", ".toml", ".ini", ".cfg", ".json", ".env"})
+
+def is_critical(path: str) -> bool:
+    """Entry points and configs are written synchronously, everything else may be buffered"""
+    pure = PurePosixPath(path.lstrip("/"))
+    return pure.name in CRITICAL_FILE_NAMES or pure.suffix in CRITICAL_SUFFIXES
+
+class AsyncArtifactWriter:
+    """
+    Queue-backed writer that runs DirectFileWriter on a daemon thread.
+
+    All writes - queued or direct - hold the same lock, because DirectFileWriter
+    stages and commits through a single git index.
+    """
+
+    def __init__(self, file_writer: DirectFileWriter):
+        self.file_writer = file_writer
+        self.lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, files: List[Dict[str, str]], commit_message: str):
+        """Queue files to be written and committed in the background"""
+        self._queue.put((files, commit_message))
+
+    def run_locked(self, func: Callable[..., Any], *args) -> Any:
+        """Run a DirectFileWriter operation synchronously, serialized with queued writes"""
+        with self.lock:
+            return func(*args)
+
+    def write_now(self, files: List[Dict[str, str]], commit_message: str,
+                  defer_commit: Optional[bool] = None) -> Dict[str, Any]:
+        """Write files synchronously, serialized with queued writes"""
+        return self.run_locked(self.file_writer.write_multiple_files, files, commit_message, defer_commit)
+
+    def join(self):
+        """Block until every queued write has been flushed to disk"""
+        self._queue.join()
+
+    def close(self):
+        """Flush every queued write, then stop the background thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)  # Queued after any pending writes
+            self._thread.join()
+
+    def _run(self):
+        """Background loop draining the write queue until close()"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            files, commit_message = item
+            try:
+                result = self.write_now(files, commit_message)
+                if result["success"]:
+                    logger.info(f"📝 Background wrote {len(result['files_created'])} files: {result['files_created']}")
+                else:
+                    logger.error(f"📝 Background write failed: {result.get('error')}")
+            except Exception as e:
+                logger.error(f"📝 Background write failed: {e}")
+            finally:
+                self._queue.task_done()
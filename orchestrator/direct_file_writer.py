@@ -4,40 +4,44 @@
 Replaces the complex tool bus with direct file operations
 """
 
+import ast
+import importlib.metadata
 import os
+import sys
 import json
 import logging
+import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-import git
+from typing import Dict, List, Any, Optional, Tuple
+
+# Fastest available JSON parser; both raise ValueError subclasses on bad input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-class DirectFileWriter:
-    """
-    Simple, direct file writer that actually works.
-    No complex tool bus - just write files where they should go.
-    """
-    
-    def __init__(self, project_path: str):
-        self.project_path = Path(project_path)
-        self.project_path.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize git repo if needed
-        self._init_git()
-        
-        logger.info(f"📁 Direct file writer initialized: {self.project_path}")
-    
-    def _init_git(self):
-        """Initialize git repository"""
-        try:
-            self.repo = git.Repo(self.project_path)
-            logger.info("📁 Using existing git repo")
-        except git.exc.InvalidGitRepositoryError:
-            self.repo = git.Repo.init(self.project_path)
-            
-            # Create .gitignore
-            gitignore_content = """# Python
+# Above this many paths, `git add` reads them from stdin instead of argv
+_PATHSPEC_STDIN_THRESHOLD = 100
+
+# Concurrent single-package installs when the batch install fails and parallel installs are enabled
+_MAX_PARALLEL_INSTALLS = 8
+
+# Commit identity used when neither the repo nor the user has one configured
+_FALLBACK_GIT_IDENTITY = ["-c", "user.name=Autonomous AI Developer", "-c", "user.email=ai-developer@localhost"]
+
+# .gitignore for new projects, stored already encoded
+_GITIGNORE = b"""# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -58,12 +62,174 @@ venv/
 # OS
 .DS_Store
 Thumbs.db
-"""
+
+# Autonomous AI Developer
+.autopilot/"""
+
+# Decodes one JSON value in place from an offset, so nested objects need no brace matching
+_json_decoder = json.JSONDecoder()
+
+# Response parsing patterns, compiled once
+_RE_PATH = re.compile(r'"path":\s*"([^"]+)"')
+_RE_CONTENT = re.compile(r'"content":\s*"([^"]+)"', re.DOTALL)
+_RE_CODE_BLOCK = re.compile(r'```(?:python|py)?\s*(?:#\s*(.+\.py))?\s*\n(.*?)\n```', re.DOTALL)
+
+# Top-level module of `import x` / `from x import ...` lines, indented ones included.
+# Only used for files that do not parse.
+_RE_IMPORT = re.compile(r'^[ \t]*(?:import\s+([a-zA-Z_][a-zA-Z0-9_]*)|from\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+import)', re.MULTILINE)
+
+# Standard library modules (don't need installation)
+STDLIB_MODULES = sys.stdlib_module_names
+
+# Package name mappings (import name -> pip package name)
+PACKAGE_MAPPINGS = {
+    'cv2': 'opencv-python',
+    'PIL': 'Pillow',
+    'sklearn': 'scikit-learn',
+    'yaml': 'PyYAML',
+    'bs4': 'beautifulsoup4',
+    'requests_oauthlib': 'requests-oauthlib',
+    'jwt': 'PyJWT',
+    'dotenv': 'python-dotenv',
+    'psycopg2': 'psycopg2-binary',
+    'MySQLdb': 'mysqlclient',
+    'discord': 'discord.py',
+    'telebot': 'pyTelegramBotAPI',
+    'yt_dlp': 'yt-dlp',
+}
+
+# PEP 503 name normalization, so "PyYAML" and "pyyaml" compare equal
+_RE_DIST_NAME_SEP = re.compile(r'[-_.]+')
+
+def _normalize_dist_name(name: str) -> str:
+    return _RE_DIST_NAME_SEP.sub('-', name).lower()
+
+# Filename heuristics, first match wins. Each rule is (triggers, filename, refinements):
+# a trigger is a keyword or a tuple of keywords that must all appear, and the first
+# refinement whose keywords appear overrides the filename. "{n}" is the block number.
+_FILENAME_RULES = tuple(
+    (tuple((t,) if isinstance(t, str) else t for t in triggers), filename, refinements)
+    for triggers, filename, refinements in (
+        ((("class", "user"), ("def", "user")), "services/user_service.py", ((("api", "endpoint"), "api/users.py"),)),
+        ((("class", "auth"), ("def", "auth"), "login"), "auth/authentication.py", ((("api", "endpoint"), "api/auth.py"),)),
+        (("database", "db", "sqlite"), "database/connection.py", ((("model",), "database/models.py"),)),
+        (("api", "endpoint", "route"), "api/routes.py", ()),
+        (("test", "assert"), "tests/test_{n}.py", ()),
+        (("config", "settings"), "config/settings.py", ()),
+        ((("model", "class"),), "models/data_models.py", ()),
+        (("util", "helper"), "utils/helpers.py", ()),
+        (("password",), "tools/password_generator.py", ()),
+        (("game", "guess"), "game.py", ()),
+        (("calculator", "add"), "calculator.py", ()),
+        (("scraper", "scrape"), "scrapers/web_scraper.py", ()),
+        (("frontend", "html", "css"), "frontend/app.py", ()),
+        (("static",), "static/main.js", ()),
+        (("template",), "templates/index.html", ()),
+    )
+)
+
+# Only this much of a block is lowercased for the keyword checks; the signal is near the top
+_FILENAME_SCAN_CHARS = 4096
+
+def _build_keyword_automaton():
+    """One Aho-Corasick automaton over every keyword the rules mention"""
+    automaton = ahocorasick.Automaton()
+    for triggers, _, refinements in _FILENAME_RULES:
+        for keyword in {k for group in triggers for k in group} | {k for keywords, _ in refinements for k in keywords}:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+# With pyahocorasick all keywords are found in one pass; otherwise each is a substring check
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _match_filename_rules(has_keyword) -> Optional[str]:
+    """Filename of the first rule whose trigger is present according to has_keyword"""
+    for triggers, filename, refinements in _FILENAME_RULES:
+        if any(all(map(has_keyword, group)) for group in triggers):
+            for keywords, refined in refinements:
+                if any(map(has_keyword, keywords)):
+                    return refined
+            return filename
+    return None
+
+def _tool_call_objects(response: str):
+    """Yield every top-level JSON object in the response that carries "tool_calls", left to right"""
+    try:
+        data = _json_loads(response)
+    except ValueError:
+        pass
+    else:
+        if isinstance(data, dict) and "tool_calls" in data:
+            yield data
+        return
+    
+    idx = response.find('{')
+    while idx != -1:
+        try:
+            data, end = _json_decoder.raw_decode(response, idx)
+        except ValueError:
+            idx = response.find('{', idx + 1)
+            continue
+        if isinstance(data, dict) and "tool_calls" in data:
+            yield data
+        idx = response.find('{', end)  # Skip past the decoded object instead of rescanning it
+
+def _write_bytes(path: Path, data: bytes):
+    """Write data with one open, as few write calls as the kernel allows, and one close"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)  # Mode still filtered by umask
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+class DirectFileWriter:
+    """
+    Simple, direct file writer that actually works.
+    No complex tool bus - just write files where they should go.
+    """
+    
+    # Snapshot of installed distribution names, shared by all writers; None means stale
+    _installed_packages: Optional[frozenset] = None
+    
+    def __init__(self, project_path: str, write_concurrency: int = 4, parallel_installs: bool = False,
+                 defer_commits: bool = False):
+        self.project_path = Path(project_path)
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        self.write_concurrency = max(1, write_concurrency)  # Parallel file writes per batch
+        self.parallel_installs = parallel_installs  # Off by default: concurrent pips can race on the wheel cache
+        self._uv_path = shutil.which("uv")  # Much faster resolver for the batch install when present
+        self._identity_args = None  # Resolved on first commit
+        self._ensured_dirs = {self.project_path}  # Directories known to exist
+        
+        # With deferred commits, writes only record what to commit; commit_pending() commits it all at once.
+        # Until then the files are on disk but not in git history, so a crash loses the commits, not the files.
+        self.defer_commits = defer_commits
+        self._pending_paths: List[str] = []
+        self._pending_messages: List[str] = []
+        
+        # Initialize git repo if needed
+        self._init_git()
+        
+        logger.info(f"📁 Direct file writer initialized: {self.project_path}")
+    
+    def _init_git(self):
+        """Initialize git repository"""
+        # A HEAD file is enough to know the repo exists; no need to load it
+        if (self.project_path / ".git" / "HEAD").is_file():
+            logger.info("📁 Using existing git repo")
+        else:
+            init = self._git(["init", "-q"])
+            if init.returncode != 0:
+                raise RuntimeError(f"git init failed: {init.stderr.strip()}")
+            
+            # Create .gitignore
             gitignore_path = self.project_path / ".gitignore"
-            gitignore_path.write_text(gitignore_content.strip())
+            gitignore_path.write_bytes(_GITIGNORE)
             
-            self.repo.index.add([".gitignore"])
-            self.repo.index.commit("Initial commit - Autonomous AI Developer")
+            self._git_add_commit([".gitignore"], "Initial commit - Autonomous AI Developer")
             
             logger.info("📁 Initialized new git repo")
     
@@ -83,22 +249,15 @@ Thumbs.db
             
             full_path = self.project_path / file_path
             
-            # Create parent directories
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write file
-            full_path.write_text(content, encoding='utf-8')
+            # Create parent directories and write file
+            self._ensure_dir(full_path.parent)
+            self._write_path(full_path, content.encode('utf-8'))
             
             logger.info(f"📄 Created file: {full_path}")
             
             # Git add and commit
-            if commit_message:
-                try:
-                    self.repo.index.add([file_path])
-                    self.repo.index.commit(commit_message)
-                    logger.info(f"📝 Committed: {commit_message}")
-                except Exception as e:
-                    logger.warning(f"📝 Git commit failed: {e}")
+            if commit_message and self._commit_files([file_path], commit_message):
+                logger.info(f"📝 Committed: {commit_message}")
             
             return True
             
@@ -106,47 +265,46 @@ Thumbs.db
             logger.error(f"❌ Failed to write {file_path}: {e}")
             return False
     
-    def write_multiple_files(self, files: List[Dict[str, str]], commit_message: str):
+    def write_multiple_files(self, files: List[Dict[str, str]], commit_message: str,
+                             defer_commit: Optional[bool] = None):
         """
         Write multiple files at once and handle dependencies
         
         Args:
             files: List of {"path": "file.py", "content": "code..."}
             commit_message: Commit message for all files
+            defer_commit: Leave the commit to commit_pending(); defaults to self.defer_commits
         """
         created_files = []
         
         try:
-            for file_info in files:
-                file_path = file_info["path"]
-                content = file_info["content"]
-                
-                # Ensure relative path
-                if file_path.startswith('/'):
-                    file_path = file_path[1:]
-                
-                full_path = self.project_path / file_path
-                
-                # Create parent directories
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Write file
-                full_path.write_text(content, encoding='utf-8')
-                created_files.append(file_path)
-                
-                logger.info(f"📄 Created file: {full_path}")
+            # Encode every payload once up front; a bad payload fails the batch before anything is written
+            payloads = [
+                (file_info["path"].lstrip('/'), file_info["content"].encode('utf-8'))
+                for file_info in files
+            ]
+            
+            # Create each distinct parent directory once, before the writes fan out
+            for parent in {(self.project_path / file_path).parent for file_path, _ in payloads}:
+                self._ensure_dir(parent)
             
-            # Auto-detect and install dependencies
-            self._auto_install_dependencies(created_files)
+            if len(payloads) == 1 or self.write_concurrency == 1:
+                for payload in payloads:
+                    created_files.append(self._write_one_file(payload))
+            else:
+                # Independent files - overlap their disk writes, then commit once below
+                workers = min(self.write_concurrency, len(payloads))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-write") as pool:
+                    created_files.extend(pool.map(self._write_one_file, payloads))
+            
+            # Auto-detect and install dependencies from the contents still in memory
+            self._auto_install_dependencies([
+                (file_path, file_info["content"]) for (file_path, _), file_info in zip(payloads, files)
+            ])
             
             # Git add and commit all files
-            if created_files:
-                try:
-                    self.repo.index.add(created_files)
-                    self.repo.index.commit(commit_message)
-                    logger.info(f"📝 Committed {len(created_files)} files: {commit_message}")
-                except Exception as e:
-                    logger.warning(f"📝 Git commit failed: {e}")
+            if created_files and self._commit_files(created_files, commit_message, defer_commit):
+                logger.info(f"📝 Committed {len(created_files)} files: {commit_message}")
             
             return {"success": True, "files_created": created_files}
             
@@ -154,6 +312,98 @@ Thumbs.db
             logger.error(f"❌ Failed to write files: {e}")
             return {"success": False, "error": str(e), "files_created": created_files}
     
+    def commit_pending(self) -> bool:
+        """Commit every deferred write with one `git add` and one `git commit`"""
+        if not self._pending_paths:
+            return False
+        
+        paths = list(dict.fromkeys(self._pending_paths))
+        messages = list(dict.fromkeys(self._pending_messages))
+        self._pending_paths, self._pending_messages = [], []
+        
+        if len(messages) == 1:
+            commit_message = messages[0]
+        else:
+            commit_message = f"{messages[0]} (+{len(messages) - 1} more)\n\n" + "\n".join(f"- {m}" for m in messages)
+        
+        committed = self._git_add_commit(paths, commit_message)
+        if committed:
+            logger.info(f"📝 Committed {len(paths)} files from {len(messages)} deferred writes")
+        return committed
+    
+    def _commit_files(self, paths: List[str], commit_message: str, defer: Optional[bool] = None) -> bool:
+        """Commit paths now, or record them for commit_pending(); True only if a commit was made"""
+        if self.defer_commits if defer is None else defer:
+            self._pending_paths.extend(paths)
+            self._pending_messages.append(commit_message)
+            return False
+        return self._git_add_commit(paths, commit_message)
+    
+    def _git_add_commit(self, paths: List[str], commit_message: str) -> bool:
+        """Stage paths and commit them with one `git add` and one `git commit` process"""
+        try:
+            if len(paths) > _PATHSPEC_STDIN_THRESHOLD:
+                add = self._git(["add", "--pathspec-from-file=-", "--"], "\n".join(paths))
+            else:
+                add = self._git(["add", "--", *paths])
+            if add.returncode != 0:
+                logger.warning(f"📝 Git add failed: {add.stderr.strip()}")
+                return False
+            
+            commit = self._git([*self._git_identity(), "commit", "-q", "-m", commit_message])
+            if commit.returncode != 0:
+                logger.warning(f"📝 Git commit failed: {(commit.stderr or commit.stdout).strip()}")
+                return False
+            return True
+        except Exception as e:
+            logger.warning(f"📝 Git commit failed: {e}")
+            return False
+    
+    def _git(self, args: List[str], stdin_text: str = None) -> subprocess.CompletedProcess:
+        """Run a git CLI command inside the project"""
+        return subprocess.run(
+            ["git", "-C", str(self.project_path), *args],
+            input=stdin_text,
+            stdin=subprocess.DEVNULL if stdin_text is None else None,
+            capture_output=True, text=True, check=False
+        )
+    
+    def _git_identity(self) -> List[str]:
+        """Config overrides for commits when no user.email is configured (checked once)"""
+        if self._identity_args is None:
+            configured = self._git(["config", "user.email"]).returncode == 0
+            self._identity_args = [] if configured else _FALLBACK_GIT_IDENTITY
+        return self._identity_args
+    
+    def _write_one_file(self, payload: Tuple[str, bytes]) -> str:
+        """Write one pre-encoded (relative path, data) payload whose parent exists; return its path"""
+        file_path, data = payload
+        full_path = self.project_path / file_path
+        
+        # Write file
+        self._write_path(full_path, data)
+        
+        logger.info(f"📄 Created file: {full_path}")
+        return file_path
+    
+    def _ensure_dir(self, directory: Path):
+        """mkdir -p, skipped for directories this writer already created or saw"""
+        if directory in self._ensured_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        while directory != self.project_path and directory not in self._ensured_dirs:
+            self._ensured_dirs.add(directory)
+            directory = directory.parent
+    
+    def _write_path(self, full_path: Path, data: bytes):
+        """Write data, recreating the parent if it was removed behind the directory cache"""
+        try:
+            _write_bytes(full_path, data)
+        except FileNotFoundError:
+            self._ensured_dirs.discard(full_path.parent)
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_bytes(full_path, data)
+    
     def parse_ai_response_and_write(self, ai_response: str, commit_message: str):
         """
         Parse AI response for file creation and write them directly
@@ -179,38 +429,32 @@ Thumbs.db
         """Parse JSON tool calls and write files"""
         try:
             # Look for JSON in the response
-            import re
-            json_matches = re.findall(r'\{[^{}]*"tool_calls"[^{}]*\}', response, re.DOTALL)
+            tool_call_objects = list(_tool_call_objects(response))
             
-            if not json_matches:
+            if not tool_call_objects:
                 # Look for direct file specifications
-                path_matches = re.findall(r'"path":\s*"([^"]+)"', response)
-                content_matches = re.findall(r'"content":\s*"([^"]+)"', response, re.DOTALL)
+                path_matches = _RE_PATH.findall(response)
+                content_matches = _RE_CONTENT.findall(response)
                 
                 if path_matches and content_matches:
                     files = [{"path": path, "content": content} 
                             for path, content in zip(path_matches, content_matches)]
                     return self.write_multiple_files(files, commit_message)
             
-            for json_str in json_matches:
-                try:
-                    data = json.loads(json_str)
-                    if "tool_calls" in data:
-                        for call in data["tool_calls"]:
-                            if call.get("name") == "repo_write":
-                                params = call.get("parameters", {})
-                                if "edits" in params:
-                                    files = []
-                                    for edit in params["edits"]:
-                                        if edit.get("mode") in ["create", "replace"]:
-                                            files.append({
-                                                "path": edit["path"],
-                                                "content": edit["content"]
-                                            })
-                                    if files:
-                                        return self.write_multiple_files(files, commit_message)
-                except json.JSONDecodeError:
-                    continue
+            for data in tool_call_objects:
+                for call in data["tool_calls"]:
+                    if call.get("name") == "repo_write":
+                        params = call.get("parameters", {})
+                        if "edits" in params:
+                            files = []
+                            for edit in params["edits"]:
+                                if edit.get("mode") in ["create", "replace"]:
+                                    files.append({
+                                        "path": edit["path"],
+                                        "content": edit["content"]
+                                    })
+                            if files:
+                                return self.write_multiple_files(files, commit_message)
             
             return {"success": False, "error": "No valid file specifications found"}
             
@@ -221,20 +465,8 @@ Thumbs.db
     def _parse_code_blocks_and_write(self, response: str, commit_message: str):
         """Parse code blocks and write files with intelligent naming"""
         try:
-            import re
-            
-            # Look for explicit file specifications first
-            file_patterns = [
-                r'(?:File|Filename|Path):\s*([a-zA-Z_][a-zA-Z0-9_/]*\.py)',
-                r'```python\s*#\s*([a-zA-Z_][a-zA-Z0-9_/]*\.py)',
-                r'```py\s*#\s*([a-zA-Z_][a-zA-Z0-9_/]*\.py)',
-                r'Create\s+file\s+([a-zA-Z_][a-zA-Z0-9_/]*\.py)',
-                r'Save\s+as\s+([a-zA-Z_][a-zA-Z0-9_/]*\.py)'
-            ]
-            
             # Look for code blocks with file names
-            pattern = r'```(?:python|py)?\s*(?:#\s*(.+\.py))?\s*\n(.*?)\n```'
-            matches = re.findall(pattern, response, re.DOTALL)
+            matches = _RE_CODE_BLOCK.findall(response)
             
             files = []
             for i, (filename, content) in enumerate(matches):
@@ -259,60 +491,23 @@ Thumbs.db
     
     def _intelligent_filename_from_content(self, content: str, index: int) -> str:
         """Generate intelligent filename with proper directory structure"""
-        content_lower = content.lower()
-        
         # Check for main application patterns
         if 'if __name__ == "__main__"' in content and ('main()' in content or 'app()' in content):
             return "main.py"
         
         # Check for specific patterns with proper directory structure
-        if 'class.*user' in content_lower or 'def.*user' in content_lower:
-            if 'api' in content_lower or 'endpoint' in content_lower:
-                return "api/users.py"
-            else:
-                return "services/user_service.py"
-        elif 'class.*auth' in content_lower or 'def.*auth' in content_lower or 'login' in content_lower:
-            if 'api' in content_lower or 'endpoint' in content_lower:
-                return "api/auth.py"
-            else:
-                return "auth/authentication.py"
-        elif 'database' in content_lower or 'db' in content_lower or 'sqlite' in content_lower:
-            if 'model' in content_lower:
-                return "database/models.py"
-            else:
-                return "database/connection.py"
-        elif 'api' in content_lower or 'endpoint' in content_lower or 'route' in content_lower:
-            return "api/routes.py"
-        elif 'test' in content_lower or 'assert' in content_lower:
-            return f"tests/test_{index + 1}.py"
-        elif 'config' in content_lower or 'settings' in content_lower:
-            return "config/settings.py"
-        elif 'model' in content_lower and 'class' in content_lower:
-            return "models/data_models.py"
-        elif 'util' in content_lower or 'helper' in content_lower:
-            return "utils/helpers.py"
-        elif 'password' in content_lower:
-            return "tools/password_generator.py"
-        elif 'game' in content_lower or 'guess' in content_lower:
-            return "game.py"
-        elif 'calculator' in content_lower or 'add' in content_lower:
-            return "calculator.py"
-        elif 'scraper' in content_lower or 'scrape' in content_lower:
-            return "scrapers/web_scraper.py"
-        elif 'frontend' in content_lower or 'html' in content_lower or 'css' in content_lower:
-            return "frontend/app.py"
-        elif 'static' in content_lower:
-            return "static/main.js"
-        elif 'template' in content_lower:
-            return "templates/index.html"
+        content_lower = content[:_FILENAME_SCAN_CHARS].lower()
+        if _KEYWORD_AUTOMATON is not None:
+            present = {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(content_lower)}
+            filename = _match_filename_rules(present.__contains__)
         else:
-            return f"modules/module_{index + 1}.py"
+            filename = _match_filename_rules(content_lower.__contains__)
+        return (filename or "modules/module_{n}.py").format(n=index + 1)
     
     def _extract_files_from_text(self, response: str) -> list:
         """Extract file information from response text when no code blocks found"""
         # This is a fallback for when the AI doesn't use code blocks
         # Look for Python code patterns in the text
-        import re
         
         # Simple heuristic: if response contains Python keywords, treat as single file
         python_keywords = ['def ', 'class ', 'import ', 'from ', 'if __name__']
@@ -322,23 +517,25 @@ Thumbs.db
         
         return []
     
-    def _auto_install_dependencies(self, created_files: List[str]):
+    def _auto_install_dependencies(self, files_with_content: List[Tuple[str, str]]):
         """
-        Auto-detect and install Python dependencies from created files
+        Auto-detect and install Python dependencies from created (path, content) pairs
         """
+        # Batches without Python files (HTML, JS, configs) skip the whole phase
+        py_sources = [(file_path, content) for file_path, content in files_with_content if file_path.endswith('.py')]
+        if not py_sources:
+            return
+        
         try:
             dependencies = set()
             
             # Scan all Python files for imports
-            for file_path in created_files:
-                if file_path.endswith('.py'):
-                    full_path = self.project_path / file_path
-                    try:
-                        content = full_path.read_text(encoding='utf-8')
-                        deps = self._extract_dependencies(content)
-                        dependencies.update(deps)
-                    except Exception as e:
-                        logger.warning(f"📦 Could not scan {file_path} for dependencies: {e}")
+            for file_path, content in py_sources:
+                try:
+                    deps = self._extract_dependencies(content)
+                    dependencies.update(deps)
+                except Exception as e:
+                    logger.warning(f"📦 Could not scan {file_path} for dependencies: {e}")
             
             if dependencies:
                 logger.info(f"📦 Detected dependencies: {list(dependencies)}")
@@ -357,80 +554,101 @@ Thumbs.db
     
     def _extract_dependencies(self, code_content: str) -> set:
         """Extract Python package dependencies from code"""
-        import re
-        
-        dependencies = set()
-        
-        # Common import patterns
-        import_patterns = [
-            r'^import\s+([a-zA-Z_][a-zA-Z0-9_]*)',
-            r'^from\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+import',
-        ]
+        try:
+            tree = ast.parse(code_content)
+        except (SyntaxError, ValueError):
+            # Generated code can be broken; fall back to scanning import lines
+            module_names = {import_name or from_name for import_name, from_name in _RE_IMPORT.findall(code_content)}
+        else:
+            module_names = set()
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    module_names.update(alias.name.split('.')[0] for alias in node.names)
+                elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                    module_names.add(node.module.split('.')[0])
         
-        # Known standard library modules (don't need installation)
-        stdlib_modules = {
-            'os', 'sys', 're', 'json', 'urllib', 'pathlib', 'logging', 'datetime',
-            'collections', 'itertools', 'functools', 'typing', 'argparse', 'subprocess',
-            'threading', 'multiprocessing', 'asyncio', 'time', 'random', 'math',
-            'string', 'io', 'tempfile', 'shutil', 'glob', 'csv', 'xml', 'html',
-            'http', 'email', 'base64', 'hashlib', 'hmac', 'secrets', 'uuid'
+        return {
+            PACKAGE_MAPPINGS.get(module_name, module_name)
+            for module_name in module_names
+            if module_name not in STDLIB_MODULES
         }
+    
+    def _install_dependencies(self, dependencies: set):
+        """Install Python packages using pip - one resolver run for the whole set"""
+        installed = self._installed_distributions()
+        packages = sorted(p for p in dependencies if _normalize_dist_name(p) not in installed)
         
-        # Package name mappings (import name -> pip package name)
-        package_mappings = {
-            'cv2': 'opencv-python',
-            'PIL': 'Pillow',
-            'sklearn': 'scikit-learn',
-            'yaml': 'PyYAML',
-            'bs4': 'beautifulsoup4',
-            'requests_oauthlib': 'requests-oauthlib',
-            'jwt': 'PyJWT',
-            'dotenv': 'python-dotenv',
-            'psycopg2': 'psycopg2-binary',
-            'MySQLdb': 'mysqlclient',
-            'discord': 'discord.py',
-            'telebot': 'pyTelegramBotAPI',
-            'yt_dlp': 'yt-dlp',
-        }
+        if not packages:
+            logger.info(f"📦 All {len(dependencies)} dependencies already installed")
+            return
         
-        lines = code_content.split('\n')
-        for line in lines:
-            line = line.strip()
-            for pattern in import_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    module_name = match.group(1)
-                    
-                    # Skip standard library modules
-                    if module_name in stdlib_modules:
-                        continue
-                    
-                    # Use mapping if available, otherwise use module name
-                    package_name = package_mappings.get(module_name, module_name)
-                    dependencies.add(package_name)
+        try:
+            logger.info(f"📦 Installing {', '.join(packages)}...")
+            if self._uv_path:
+                result = self._uv_install(packages, timeout=600)
+            else:
+                result = self._pip_install(packages, timeout=600)
+            
+            if result.returncode == 0:
+                logger.info(f"✅ Successfully installed {len(packages)} packages")
+                DirectFileWriter._installed_packages = None
+                return
+            
+            logger.warning(f"❌ Batch install failed, retrying packages one by one: {result.stderr}")
+        except subprocess.TimeoutExpired:
+            logger.warning("⏰ Batch installation timed out, retrying packages one by one")
+        except Exception as e:
+            logger.warning(f"❌ Error installing packages: {e}")
+            return
         
-        return dependencies
+        # One bad name fails the whole batch; install individually so the rest still land
+        if len(packages) > 1 or self._uv_path:
+            if self.parallel_installs and len(packages) > 1:
+                workers = min(_MAX_PARALLEL_INSTALLS, len(packages))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pip-install") as pool:
+                    list(pool.map(self._install_one, packages))
+            else:
+                for package in packages:
+                    self._install_one(package)
     
-    def _install_dependencies(self, dependencies: set):
-        """Install Python packages using pip"""
-        import subprocess
-        
-        for package in dependencies:
-            try:
-                logger.info(f"📦 Installing {package}...")
-                result = subprocess.run([
-                    'python3', '-m', 'pip', 'install', '--user', package
-                ], capture_output=True, text=True, timeout=300)
+    def _install_one(self, package: str):
+        """Install a single package with pip, logging the outcome"""
+        try:
+            result = self._pip_install([package], timeout=300)
+            
+            if result.returncode == 0:
+                logger.info(f"✅ Successfully installed {package}")
+                DirectFileWriter._installed_packages = None
+            else:
+                logger.warning(f"❌ Failed to install {package}: {result.stderr}")
                 
-                if result.returncode == 0:
-                    logger.info(f"✅ Successfully installed {package}")
-                else:
-                    logger.warning(f"❌ Failed to install {package}: {result.stderr}")
-                    
-            except subprocess.TimeoutExpired:
-                logger.warning(f"⏰ Installation of {package} timed out")
-            except Exception as e:
-                logger.warning(f"❌ Error installing {package}: {e}")
+        except subprocess.TimeoutExpired:
+            logger.warning(f"⏰ Installation of {package} timed out")
+        except Exception as e:
+            logger.warning(f"❌ Error installing {package}: {e}")
+    
+    @classmethod
+    def _installed_distributions(cls) -> frozenset:
+        """Normalized names of installed distributions, snapshotted until the next install"""
+        if cls._installed_packages is None:
+            cls._installed_packages = frozenset(
+                _normalize_dist_name(dist.metadata['Name'])
+                for dist in importlib.metadata.distributions()
+                if dist.metadata['Name']
+            )
+        return cls._installed_packages
+    
+    def _pip_install(self, packages: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """Run one non-interactive pip install for the given packages"""
+        return subprocess.run([
+            'python3', '-m', 'pip', 'install', '--user', '--no-input', '--disable-pip-version-check', *packages
+        ], capture_output=True, text=True, timeout=timeout, stdin=subprocess.DEVNULL)
+    
+    def _uv_install(self, packages: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """Run one uv install into the same interpreter pip would use"""
+        return subprocess.run([
+            self._uv_path, 'pip', 'install', '--python', 'python3', *packages
+        ], capture_output=True, text=True, timeout=timeout, stdin=subprocess.DEVNULL)
 
 # Test the direct file writer
 def test_direct_writer():
@@ -7,7 +7,10 @@ Helps new users get started quickly with proper setup verification
 import sys
 import subprocess
 import json
-import requests
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 
 def check_python_version():
@@ -20,26 +23,29 @@ def check_python_version():
         print(f"❌ Python {version.major}.{version.minor}.{version.micro} - Need Python 3.11+")
         return False
 
-def check_ollama_connection():
-    """Check if Ollama is running and accessible"""
+def fetch_ollama_models():
+    """List the models Ollama serves (network only, no output)"""
+    with urllib.request.urlopen("http://localhost:11434/api/tags", timeout=5) as response:
+        return json.loads(response.read()).get("models", [])
+
+def check_ollama_connection(pending: Future = None):
+    """Check if Ollama is running and accessible, optionally from an already started fetch"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            models = response.json().get("models", [])
-            print(f"✅ Ollama connected - {len(models)} models available")
-            return True, models
-        else:
-            print("❌ Ollama not responding properly")
-            return False, []
-    except requests.exceptions.RequestException:
+        models = pending.result() if pending is not None else fetch_ollama_models()
+        print(f"✅ Ollama connected - {len(models)} models available")
+        return True, models
+    except (urllib.error.HTTPError, ValueError):
+        print("❌ Ollama not responding properly")
+        return False, []
+    except (urllib.error.URLError, OSError):
         print("❌ Ollama not running or not accessible at http://localhost:11434")
         print("💡 Start Ollama with: ollama serve")
         return False, []
 
-def check_required_model():
-    """Check if a suitable model is available"""
-    connected, models = check_ollama_connection()
-    if not connected:
+def check_required_model(models):
+    """Check if a suitable model is among the ones Ollama reported"""
+    if not models:
+        print("❌ No models available from Ollama")
         return False
     
     suitable_models = []
@@ -63,12 +69,14 @@ def check_dependencies():
         "dataclasses-json", "fastapi", "uvicorn", "requests", "pytest"
     ]
     
+    # Installed metadata only - nothing is imported, and distribution names
+    # like pyyaml or gitpython don't have to match their module names
     missing = []
     for package in required_packages:
         try:
-            __import__(package.replace("-", "_"))
+            distribution(package)
             print(f"✅ {package} - installed")
-        except ImportError:
+        except PackageNotFoundError:
             missing.append(package)
             print(f"❌ {package} - missing")
     
@@ -103,23 +111,33 @@ def main():
     """Main quick start verification"""
     print("🚀 Infinite AI Developer - Quick Start Verification\n")
     
-    checks = [
-        ("Python Version", check_python_version),
-        ("Ollama Connection", lambda: check_ollama_connection()[0]),
-        ("Coding Model", check_required_model),
-        ("Dependencies", check_dependencies),
-        ("System Test", run_quick_test)
-    ]
-    
-    passed = 0
-    total = len(checks)
-    
-    for name, check_func in checks:
-        print(f"\n🔍 Checking {name}...")
-        if check_func():
-            passed += 1
-        else:
-            print(f"❌ {name} check failed")
+    # The Ollama round trip is the only slow check - start it now and let the
+    # local checks run meanwhile; one request serves both Ollama checks
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending_models = pool.submit(fetch_ollama_models)
+        ollama = {}
+        
+        def ollama_connection():
+            ollama["connected"], ollama["models"] = check_ollama_connection(pending_models)
+            return ollama["connected"]
+        
+        checks = [
+            ("Python Version", check_python_version),
+            ("Dependencies", check_dependencies),
+            ("Ollama Connection", ollama_connection),
+            ("Coding Model", lambda: check_required_model(ollama["models"])),
+            ("System Test", run_quick_test)
+        ]
+        
+        passed = 0
+        total = len(checks)
+        
+        for name, check_func in checks:
+            print(f"\n🔍 Checking {name}...")
+            if check_func():
+                passed += 1
+            else:
+                print(f"❌ {name} check failed")
     
     print(f"\n📊 Results: {passed}/{total} checks passed")
     
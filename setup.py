@@ -11,8 +11,22 @@ with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 # Read requirements
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+def read_requirements(path):
+    with open(path, "r", encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+
+requirements = read_requirements("requirements.txt")
+speedups = read_requirements("requirements-speedups.txt")  # Optional native accelerators
+
+# Optional AOT compilation of the hot validation path (INFINITE_AI_MYPYC=1).
+# mypyc ships with mypy; without it the pure-Python module is installed as-is.
+ext_modules = []
+if os.environ.get("INFINITE_AI_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+        ext_modules = mypycify(["models/schemas.py"])
+    except ImportError:
+        print("⚠️ mypyc not available - installing pure-Python models.schemas")
 
 setup(
     name="infinite-ai-developer",
@@ -37,6 +51,8 @@ setup(
     ],
     python_requires=">=3.11",
     install_requires=requirements,
+    extras_require={"speedups": speedups},
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "infinite-ai=main_infinite:main",
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+🐳 Docker Socket Client - Async Docker Engine API over the daemon's Unix socket
+Lets sandbox container calls run on the event loop instead of docker-py's worker threads
+"""
+
+import asyncio
+import json
+import os
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+# Where the Docker daemon listens unless DOCKER_HOST says otherwise
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Stream ids in the multiplexed exec output frame header
+_STDOUT, _STDERR = 1, 2
+
+class DockerAPIError(Exception):
+    """The Docker daemon answered with an error status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Docker API error {status}: {message}")
+        self.status = status
+
+def default_socket_path() -> Optional[str]:
+    """The default daemon socket, if Docker is reached through it; None means use docker-py"""
+    docker_host = os.environ.get("DOCKER_HOST")
+    if docker_host and docker_host != f"unix://{DEFAULT_DOCKER_SOCKET}":
+        return None
+    return DEFAULT_DOCKER_SOCKET if os.path.exists(DEFAULT_DOCKER_SOCKET) else None
+
+class DockerSocketClient:
+    """
+    Minimal async client for the container and exec endpoints the sandbox uses.
+
+    One aiohttp session over a UnixConnector is shared for the client's
+    lifetime; it is created lazily on the running loop.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_DOCKER_SOCKET):
+        self.socket_path = socket_path
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared socket session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.UnixConnector(path=self.socket_path),
+                timeout=aiohttp.ClientTimeout(total=None)  # Commands enforce their own timeout
+            )
+        return self._session
+
+    async def _request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one API request and return its decoded JSON body (None if empty)"""
+        session = await self._get_session()
+        async with session.request(method, f"http://docker{path}", json=body) as resp:
+            payload = await resp.read()
+            if resp.status >= 400:
+                try:
+                    message = json.loads(payload).get("message", "")
+                except ValueError:
+                    message = payload.decode("utf-8", errors="ignore")
+                raise DockerAPIError(resp.status, message)
+            return json.loads(payload) if payload else None
+
+    async def run_container(self, spec: Dict[str, Any]) -> str:
+        """Create and start a container from an Engine API create body; returns its id"""
+        container_id = (await self._request("POST", "/containers/create", spec))["Id"]
+        await self._request("POST", f"/containers/{container_id}/start")
+        return container_id
+
+    async def kill(self, container_id: str):
+        """Kill a container"""
+        await self._request("POST", f"/containers/{container_id}/kill")
+
+    async def exec_run(self, container_id: str, argv: List[str], environment: Dict[str, str],
+                       workdir: str, user: str, max_bytes: int) -> Tuple[int, bytes, bytes]:
+        """
+        Run a command in a container and return (exit code, stdout, stderr)
+
+        The multiplexed output is split into its streams as frames arrive;
+        each stream keeps at most max_bytes and the rest is drained.
+        """
+        exec_id = (await self._request("POST", f"/containers/{container_id}/exec", {
+            "Cmd": argv,
+            "Env": [f"{key}={value}" for key, value in environment.items()],
+            "WorkingDir": workdir,
+            "User": user,
+            "AttachStdout": True,
+            "AttachStderr": True
+        }))["Id"]
+
+        buffers = {_STDOUT: bytearray(), _STDERR: bytearray()}
+        session = await self._get_session()
+        async with session.post(f"http://docker/exec/{exec_id}/start",
+                                json={"Detach": False, "Tty": False}) as resp:
+            if resp.status >= 400:
+                raise DockerAPIError(resp.status, (await resp.read()).decode("utf-8", errors="ignore"))
+
+            # Each frame: stream id, 3 padding bytes, big-endian payload length, payload
+            while True:
+                try:
+                    header = await resp.content.readexactly(8)
+                except asyncio.IncompleteReadError:
+                    break
+                stream_id, length = struct.unpack(">BxxxL", header)
+                payload = await resp.content.readexactly(length)
+                buf = buffers.get(stream_id)
+                if buf is not None and len(buf) < max_bytes:
+                    buf += payload[:max_bytes - len(buf)]
+
+        exit_code = (await self._request("GET", f"/exec/{exec_id}/json"))["ExitCode"]
+        return exit_code, bytes(buffers[_STDOUT]), bytes(buffers[_STDERR])
+
+    async def aclose(self):
+        """Close the socket session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -8,17 +8,152 @@ Handles all file I/O, git operations, and code editing for the autonomous system
 
 import os
 import git
+import fnmatch
+import hashlib
 import json
+import re
 import shutil
+import stat
 import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
 from dataclasses import dataclass
-import tempfile
+import threading
+import time
 import logging
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    PATHSPEC_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Directories that never hold project sources worth reading: caches, environments, build output
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    "__pycache__", ".git", ".venv", "venv", "node_modules", "dist", "build", ".pytest_cache"
+})
+
+# Upper bound on threads reading files concurrently
+_MAX_READ_WORKERS = 32
+
+# How long get_status may serve its last answer to tight polling loops
+_STATUS_TTL_SEC = 1.0
+
+# A file modified this recently may change again within the same mtime tick, so a
+# matching stat alone doesn't prove its cached content is current
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Cached per-file search results kept across queries before the cache starts over
+_SEARCH_CACHE_MAX_ENTRIES = 50_000
+
+# File bytes held by the read cache before the least recently used files are dropped
+_CONTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# A search query without these characters is a plain literal and skips the regex engine
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Compiled fnmatch regex per glob component; patterns are inputs, so this is never invalidated
+_component_regexes: Dict[str, "re.Pattern"] = {}
+
+def _component_matches(name: str, part: str, include_hidden: bool = False) -> bool:
+    """fnmatch one path component, hiding dotfiles from wildcards as glob does (Path.glob doesn't)"""
+    if not include_hidden and name.startswith('.') and not part.startswith('.'):
+        return False
+    regex = _component_regexes.get(part)
+    if regex is None:
+        regex = _component_regexes[part] = re.compile(fnmatch.translate(part))
+    return regex.match(name) is not None
+
+def _fingerprint(raw: bytes) -> bytes:
+    """Content fingerprint for the read cache: xxh3 when available, else blake2b"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_digest(raw)
+    return hashlib.blake2b(raw, digest_size=8).digest()
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    """What must stay the same for a file to count as untouched"""
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+def _is_settled(st: os.stat_result) -> bool:
+    """Old enough that an unchanged stat really means unchanged content"""
+    return time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS
+
+def _pattern_closure(parts: Tuple[str, ...], positions: set) -> set:
+    """Pattern positions live in a directory: a ** may also match zero directories"""
+    closed = set()
+    for pos in positions:
+        while pos < len(parts) and parts[pos] == "**":
+            closed.add(pos)
+            pos += 1
+        closed.add(pos)
+    return closed
+
+def _with_git_headers(patch_content: str) -> str:
+    """
+    Add the `diff --git` line libgit2 requires before each file of a plain
+    unified diff (`--- a/x` / `+++ b/x` only); git-style patches pass through.
+    """
+    if "diff --git " in patch_content:
+        return patch_content
+    
+    lines = patch_content.splitlines(keepends=True)
+    out = []
+    for i, line in enumerate(lines):
+        if line.startswith("--- ") and i + 1 < len(lines) and lines[i + 1].startswith("+++ "):
+            old = line[4:].split("\t")[0].strip()
+            new = lines[i + 1][4:].split("\t")[0].strip()
+            out.append(f"diff --git {old if old != '/dev/null' else new} {new if new != '/dev/null' else old}\n")
+        out.append(line)
+    return "".join(out)
+
+def _branch_from_header(header: str) -> str:
+    """Branch name from a porcelain `## ...` header"""
+    for prefix in ("No commits yet on ", "Initial commit on "):
+        if header.startswith(prefix):
+            return header[len(prefix):]
+    if header.startswith("HEAD (no branch)"):
+        return "unknown"
+    return header.split("...")[0].split(" [")[0]
+
+def _compile_hyperscan(query: str) -> Optional["hyperscan.Database"]:
+    """Block-mode Hyperscan database for a search query, or None if Hyperscan can't express it"""
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[query.encode('utf-8')],
+            ids=[0],
+            # UTF8 + UCP: '.', \w and case folding work on characters, like str patterns in re
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_MULTILINE
+                   | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP]
+        )
+        return database
+    except hyperscan.error as e:
+        # Backreferences, lookarounds, empty matches... - the re scan handles those
+        logger.debug(f"📁 Hyperscan can't compile {query!r} ({e}), using re")
+        return None
+
 @dataclass
 class FileEdit:
     """Represents a file edit operation"""
@@ -46,12 +181,40 @@ class RepoService:
         self.repo_path = Path(repo_path)
         self.repo: Optional[git.Repo] = None
         
+        # Glob expansions: pattern -> (mtime_ns of every directory the glob lists, matches)
+        self._glob_cache: Dict[Tuple[str, bool], Tuple[List[Tuple[str, int]], List[Path]]] = {}
+        
+        # (monotonic time, status) of the last get_status call
+        self._status_cache: Optional[Tuple[float, RepoStatus]] = None
+        
+        # Per-file results of earlier scans, reused while the file is unchanged:
+        # (path, max_bytes) -> (stat key, fingerprint, _read_one result); an LRU bounded
+        # by _CONTENT_CACHE_MAX_BYTES and shared by the reader threads, hence the lock
+        self._content_cache: "OrderedDict[Tuple[str, int], Tuple[Tuple[int, int, int], bytes, Any]]" = OrderedDict()
+        self._content_cache_bytes = 0
+        self._content_lock = threading.Lock()
+        # (query, path) -> (stat key, matches)
+        self._search_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = {}
+        
+        # Root .gitignore matcher, reparsed when the file's (size, mtime_ns) changes
+        self._ignore_spec: Optional["pathspec.GitIgnoreSpec"] = None
+        self._ignore_key: Optional[Tuple[int, int]] = None
+        self._ignore_loaded = False
+        
         # Ensure repo path exists
         self.repo_path.mkdir(parents=True, exist_ok=True)
         
         # Initialize or open git repo
         self._init_git_repo()
         
+        # libgit2 handle for in-process patch application, when pygit2 is installed
+        self._pg_repo = None
+        if PYGIT2_AVAILABLE:
+            try:
+                self._pg_repo = pygit2.Repository(str(self.repo_path))
+            except pygit2.GitError as e:
+                logger.warning(f"📁 pygit2 could not open repo, patches use git apply: {e}")
+        
         logger.info(f"📁 Repo service initialized at: {self.repo_path}")
     
     def _init_git_repo(self):
@@ -108,19 +271,20 @@ memory/states/
             
             logger.info(f"📁 Initialized new git repo")
     
-    def read_files(self, paths: List[str], max_bytes: int = 200000) -> Dict[str, Any]:
+    def read_files(self, paths: List[str], max_bytes: int = 200000,
+                   exclude_dirs: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Read files from the repository
         
         Args:
             paths: List of file paths (supports glob patterns)
             max_bytes: Maximum bytes to read per file
+            exclude_dirs: Directory names whose files are skipped before opening
+                (e.g. DEFAULT_EXCLUDE_DIRS)
             
         Returns:
             Dictionary with file contents and metadata
         """
-        import glob
-        
         result = {
             "files": {},
             "total_files": 0,
@@ -129,49 +293,49 @@ memory/states/
         }
         
         try:
-            # Expand glob patterns
+            # Expand glob patterns; overlapping patterns must not read a file twice,
+            # and share directory listings so each directory is scanned once
             all_files = []
-            for pattern in paths:
+            listings: Dict[str, Any] = {}
+            for pattern in dict.fromkeys(paths):
                 if "*" in pattern or "?" in pattern:
                     # Glob pattern
-                    matches = glob.glob(str(self.repo_path / pattern), recursive=True)
-                    all_files.extend([Path(f).relative_to(self.repo_path) for f in matches])
+                    all_files.extend(self._expand(pattern, listings))
                 else:
                     # Direct path
                     all_files.append(Path(pattern))
+            all_files = list(dict.fromkeys(all_files))
             
-            # Read each file
-            for file_path in all_files:
-                full_path = self.repo_path / file_path
-                
-                if not full_path.exists():
-                    logger.warning(f"📁 File not found: {file_path}")
+            # Drop files under excluded directories before touching them
+            if exclude_dirs:
+                excluded = frozenset(exclude_dirs)
+                all_files = [f for f in all_files if excluded.isdisjoint(f.parts[:-1])]
+            
+            # Read files concurrently - the GIL is released while waiting on the disk.
+            # map keeps the results in request order
+            def read(file_path: Path):
+                return self._read_one(file_path, max_bytes)
+            
+            if len(all_files) > 1:
+                with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(all_files)),
+                                        thread_name_prefix="repo-read") as pool:
+                    reads = list(pool.map(read, all_files))
+            else:
+                reads = [read(file_path) for file_path in all_files]
+            
+            for file_path, read_result in zip(all_files, reads):
+                if read_result is None:
                     continue
                 
-                if full_path.is_dir():
+                entry, bytes_read, truncated = read_result
+                result["files"][str(file_path)] = entry
+                if "error" in entry:
                     continue
                 
-                try:
-                    # Read file content
-                    content = full_path.read_text(encoding='utf-8', errors='ignore')
-                    
-                    # Truncate if too large
-                    if len(content.encode('utf-8')) > max_bytes:
-                        content = content[:max_bytes] + "\n... [TRUNCATED]"
-                        result["truncated_files"].append(str(file_path))
-                    
-                    result["files"][str(file_path)] = {
-                        "content": content,
-                        "size": full_path.stat().st_size,
-                        "modified": full_path.stat().st_mtime
-                    }
-                    
-                    result["total_files"] += 1
-                    result["total_bytes"] += len(content.encode('utf-8'))
-                    
-                except Exception as e:
-                    logger.error(f"📁 Error reading {file_path}: {e}")
-                    result["files"][str(file_path)] = {"error": str(e)}
+                if truncated:
+                    result["truncated_files"].append(str(file_path))
+                result["total_files"] += 1
+                result["total_bytes"] += bytes_read
             
             logger.info(f"📁 Read {result['total_files']} files ({result['total_bytes']} bytes)")
             return result
@@ -180,6 +344,218 @@ memory/states/
             logger.error(f"📁 Error in read_files: {e}")
             return {"error": str(e)}
     
+    def _expand(self, pattern: str, listings: Optional[Dict[str, Any]] = None,
+                include_hidden: bool = False) -> List[Path]:
+        """
+        Glob a pattern relative to the repo, reusing the last expansion while
+        every directory it listed keeps its mtime (entries added, removed or
+        renamed always bump their directory's mtime).
+        
+        Callers expanding several patterns pass one `listings` dict so each
+        directory is stat'd and scanned at most once across all of them.
+        
+        Wildcards skip dotfiles like glob.glob; include_hidden matches them
+        like Path.glob instead (the .git directory itself is still skipped).
+        """
+        if listings is None:
+            listings = {}
+        ignore = self._gitignore()
+        
+        cache_key = (pattern, include_hidden)
+        cached = self._glob_cache.get(cache_key)
+        if cached is not None:
+            listed_dirs, matches = cached
+            try:
+                if all(os.stat(path).st_mtime_ns == mtime for path, mtime in listed_dirs):
+                    return matches
+            except OSError:
+                pass  # A listed directory is gone
+        
+        listed_dirs: List[Tuple[str, int]] = []
+        matches: List[Path] = []
+        self._walk_pattern(str(self.repo_path), Path(), Path(pattern).parts,
+                           _pattern_closure(Path(pattern).parts, {0}), listed_dirs, matches, listings, ignore,
+                           include_hidden)
+        self._glob_cache[cache_key] = (listed_dirs, matches)
+        return matches
+    
+    def _gitignore(self) -> Optional["pathspec.GitIgnoreSpec"]:
+        """
+        Matcher for the repo's root .gitignore (None without one, or without pathspec).
+        
+        Checked with one stat per expansion; a changed .gitignore drops the glob
+        cache, since it never bumps the mtime of the directories it filters.
+        """
+        if not PATHSPEC_AVAILABLE:
+            return None
+        
+        gitignore = self.repo_path / ".gitignore"
+        try:
+            st = gitignore.stat()
+            key = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            key = None
+        
+        if not self._ignore_loaded or key != self._ignore_key:
+            self._ignore_loaded, self._ignore_key, self._ignore_spec = True, key, None
+            self._glob_cache.clear()
+            if key is not None:
+                try:
+                    self._ignore_spec = pathspec.GitIgnoreSpec.from_lines(
+                        gitignore.read_text(encoding='utf-8', errors='ignore').splitlines()
+                    )
+                except OSError as e:
+                    logger.warning(f"📁 Could not read .gitignore: {e}")
+        
+        return self._ignore_spec
+    
+    @staticmethod
+    def _list_dir(directory: str, listings: Dict[str, Any]) -> Optional[Tuple[int, List[os.DirEntry]]]:
+        """(mtime_ns, entries) of a directory, scanned once per expansion call; None if unreadable"""
+        if directory not in listings:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as it:
+                    listings[directory] = (mtime, list(it))
+            except OSError:
+                listings[directory] = None
+        return listings[directory]
+    
+    def _walk_pattern(self, directory: str, rel_dir: Path, parts: Tuple[str, ...], positions: set,
+                      listed_dirs: List[Tuple[str, int]], matches: List[Path], listings: Dict[str, Any],
+                      ignore: Optional["pathspec.GitIgnoreSpec"] = None, include_hidden: bool = False):
+        """
+        One scandir per directory, matching entries against every pattern part
+        still live at this depth (several at once, because ** can stop anywhere).
+        Only directories some part can still descend into are entered, and
+        gitignored entries are skipped (ignored directories are never entered).
+        """
+        listing = self._list_dir(directory, listings)
+        if listing is None:
+            return
+        mtime, entries = listing
+        listed_dirs.append((directory, mtime))
+        
+        rel_prefix = f"{rel_dir.as_posix()}/" if rel_dir.parts else ""
+        last = len(parts) - 1
+        for entry in entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if ignore is not None and ignore.match_file(f"{rel_prefix}{entry.name}{'/' if is_dir else ''}"):
+                continue
+            child_positions = set()
+            matched = False
+            
+            for pos in positions:
+                if pos > last:
+                    continue
+                part = parts[pos]
+                if part == "**":
+                    # Like glob, ** spans non-hidden names only (Path.glob spans all but .git)
+                    if entry.name.startswith('.') and (not include_hidden or entry.name == ".git"):
+                        continue
+                    if is_dir:
+                        child_positions.add(pos)
+                    matched = matched or pos == last
+                elif _component_matches(entry.name, part, include_hidden):
+                    if pos == last:
+                        matched = True
+                    elif is_dir:
+                        child_positions.add(pos + 1)
+            
+            if matched and not is_dir and entry.is_file():
+                matches.append(rel_dir / entry.name)
+            if child_positions:
+                self._walk_pattern(entry.path, rel_dir / entry.name, parts,
+                                   _pattern_closure(parts, child_positions), listed_dirs, matches, listings, ignore,
+                                   include_hidden)
+    
+    def _read_one(self, file_path: Path, max_bytes: int) -> Optional[Tuple[Dict[str, Any], int, bool]]:
+        """
+        Read one file with a single stat and a single decode.
+        
+        An unchanged stat reuses the previous result without opening the file;
+        otherwise bytes with an unchanged fingerprint skip the decode.
+        
+        Returns (entry, bytes kept, truncated), or None for missing paths and directories.
+        """
+        full_path = self.repo_path / file_path
+        
+        cache_key = (str(file_path), max_bytes)
+        try:
+            st = full_path.stat()
+        except FileNotFoundError:
+            logger.warning(f"📁 File not found: {file_path}")
+            self._drop_content(cache_key)
+            return None
+        
+        if stat.S_ISDIR(st.st_mode):
+            return None
+        
+        cached = self._cached_content(cache_key)
+        if cached is not None and cached[0] == _stat_key(st) and _is_settled(st):
+            entry, bytes_read, truncated = cached[2]
+            return dict(entry), bytes_read, truncated
+        
+        try:
+            # One byte past the limit is enough to know the file must be truncated
+            with open(full_path, 'rb') as f:
+                raw = f.read(max_bytes + 1)
+        except Exception as e:
+            logger.error(f"📁 Error reading {file_path}: {e}")
+            self._drop_content(cache_key)
+            return {"error": str(e)}, 0, False
+        
+        # Same bytes as last time (e.g. rewritten unchanged) - only the metadata is new
+        digest = _fingerprint(raw)
+        if cached is not None and cached[1] == digest:
+            entry, bytes_read, truncated = cached[2]
+            entry = {**entry, "size": st.st_size, "modified": st.st_mtime}
+            self._store_content(cache_key, (_stat_key(st), digest, (entry, bytes_read, truncated)))
+            return dict(entry), bytes_read, truncated
+        
+        # Truncate if too large - measured on the bytes already in hand, no re-encoding
+        truncated = len(raw) > max_bytes
+        if truncated:
+            raw = raw[:max_bytes]
+        content = raw.decode('utf-8', errors='ignore')
+        if truncated:
+            content += "\n... [TRUNCATED]"
+        
+        entry = {
+            "content": content,
+            "size": st.st_size,
+            "modified": st.st_mtime
+        }
+        self._store_content(cache_key, (_stat_key(st), digest, (entry, len(raw), truncated)))
+        return dict(entry), len(raw), truncated
+    
+    def _cached_content(self, key: Tuple[str, int]) -> Optional[Tuple[Tuple[int, int, int], bytes, Any]]:
+        """Read-cache entry for a file, marked as recently used"""
+        with self._content_lock:
+            cached = self._content_cache.get(key)
+            if cached is not None:
+                self._content_cache.move_to_end(key)
+            return cached
+    
+    def _store_content(self, key: Tuple[str, int], value: Tuple[Tuple[int, int, int], bytes, Any]):
+        """Cache a read result, dropping the least recently used past the byte budget"""
+        with self._content_lock:
+            old = self._content_cache.pop(key, None)
+            if old is not None:
+                self._content_cache_bytes -= old[2][1]
+            self._content_cache[key] = value
+            self._content_cache_bytes += value[2][1]
+            while self._content_cache_bytes > _CONTENT_CACHE_MAX_BYTES and len(self._content_cache) > 1:
+                _, evicted = self._content_cache.popitem(last=False)
+                self._content_cache_bytes -= evicted[2][1]
+    
+    def _drop_content(self, key: Tuple[str, int]):
+        """Forget a file that can no longer be read"""
+        with self._content_lock:
+            old = self._content_cache.pop(key, None)
+            if old is not None:
+                self._content_cache_bytes -= old[2][1]
+    
     def write_files(self, edits: List[FileEdit], commit_message: str) -> Dict[str, Any]:
         """
         Write/edit files in the repository
@@ -199,8 +575,15 @@ memory/states/
         }
         
         try:
+            # Consecutive patch edits are applied together by one git apply
+            pending_patches: List[FileEdit] = []
+            
             # Apply each edit
             for edit in edits:
+                if edit.mode != "patch" and pending_patches:
+                    self._apply_patch_run(pending_patches, result)
+                    pending_patches = []
+                
                 try:
                     file_path = self.repo_path / edit.path
                     
@@ -225,12 +608,9 @@ memory/states/
                             result["errors"].append(f"Cannot patch non-existent file: {edit.path}")
                             continue
                         
-                        # Apply unified diff patch
-                        success = self._apply_patch(file_path, edit.patch)
-                        if success:
-                            result["files_modified"].append(edit.path)
-                        else:
-                            result["errors"].append(f"Failed to apply patch to: {edit.path}")
+                        # Applied with the rest of this run of patches
+                        pending_patches.append(edit)
+                        continue
                     
                     logger.info(f"📁 {edit.mode.title()}: {edit.path}")
                     
@@ -239,8 +619,14 @@ memory/states/
                     result["errors"].append(error_msg)
                     logger.error(f"📁 {error_msg}")
             
+            if pending_patches:
+                self._apply_patch_run(pending_patches, result)
+            
             # Git add and commit if any files were modified
             modified_files = result["files_created"] + result["files_modified"]
+            if modified_files:
+                self._glob_cache.clear()
+                self._status_cache = None
             if modified_files and not result["errors"]:
                 try:
                     self.repo.index.add(modified_files)
@@ -259,46 +645,103 @@ memory/states/
             logger.error(f"📁 Error in write_files: {e}")
             return {"success": False, "error": str(e)}
     
+    def _apply_patch_run(self, patch_edits: List[FileEdit], result: Dict[str, Any]):
+        """
+        Apply consecutive patch edits as one combined unified diff.
+        
+        git apply is all-or-nothing, so if the combined patch is rejected the
+        tree is untouched and each edit is retried alone to keep partial success.
+        """
+        if len(patch_edits) > 1:
+            combined = "".join(edit.patch if edit.patch.endswith("\n") else edit.patch + "\n"
+                               for edit in patch_edits)
+            if self._git_apply(combined, log_failure=False):
+                for edit in patch_edits:
+                    result["files_modified"].append(edit.path)
+                    logger.info(f"📁 Patch: {edit.path}")
+                return
+            logger.info(f"📁 Combined patch rejected, applying {len(patch_edits)} patches one by one")
+        
+        for edit in patch_edits:
+            # Apply unified diff patch
+            if self._apply_patch(self.repo_path / edit.path, edit.patch):
+                result["files_modified"].append(edit.path)
+            else:
+                result["errors"].append(f"Failed to apply patch to: {edit.path}")
+            logger.info(f"📁 Patch: {edit.path}")
+    
     def _apply_patch(self, file_path: Path, patch_content: str) -> bool:
         """Apply a unified diff patch to a file"""
-        try:
-            # Create temporary patch file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.patch', delete=False) as f:
-                f.write(patch_content)
-                patch_file = f.name
-            
+        return self._git_apply(patch_content)
+    
+    def _git_apply(self, patch_content: str, log_failure: bool = True) -> bool:
+        """Apply a unified diff to the working tree, in-process through libgit2 when available"""
+        if self._pg_repo is not None:
             try:
-                # Apply patch using git apply
-                subprocess.run([
-                    "git", "apply", "--check", patch_file
-                ], cwd=self.repo_path, check=True, capture_output=True)
-                
-                subprocess.run([
-                    "git", "apply", patch_file
-                ], cwd=self.repo_path, check=True, capture_output=True)
-                
+                diff = pygit2.Diff.parse_diff(_with_git_headers(patch_content))
+                self._pg_repo.apply(diff, pygit2.GIT_APPLY_LOCATION_WORKDIR)  # Like plain `git apply`
                 return True
-                
-            finally:
-                # Clean up temp file
-                os.unlink(patch_file)
-                
+            except pygit2.GitError as e:
+                # libgit2 is stricter than git about malformed patches - let git have a go
+                logger.debug(f"📁 libgit2 rejected patch ({e}), retrying with git apply")
+        
+        try:
+            # One git apply reading the patch from stdin - it checks every hunk
+            # before touching the tree, so a separate --check pass is redundant
+            subprocess.run([
+                "git", "apply", "-"
+            ], cwd=self.repo_path, input=patch_content.encode('utf-8'), check=True, capture_output=True)
+            
+            return True
+            
         except subprocess.CalledProcessError as e:
-            logger.error(f"📁 Patch application failed: {e.stderr.decode()}")
+            if log_failure:
+                logger.error(f"📁 Patch application failed: {e.stderr.decode()}")
             return False
         except Exception as e:
             logger.error(f"📁 Patch error: {e}")
             return False
     
     def get_status(self) -> RepoStatus:
-        """Get current repository status"""
+        """
+        Get current repository status.
+        
+        Branch, staged, modified and untracked files all come from one
+        `git status --porcelain -z` run; answers younger than _STATUS_TTL_SEC are reused.
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < _STATUS_TTL_SEC:
+            return self._status_cache[1]
+        
         try:
-            return RepoStatus(
-                branch=self.repo.active_branch.name,
-                modified_files=[item.a_path for item in self.repo.index.diff(None)],
-                untracked_files=self.repo.untracked_files,
-                staged_files=[item.a_path for item in self.repo.index.diff("HEAD")]
-            )
+            out = subprocess.run(
+                ["git", "status", "--porcelain=v1", "-z", "--branch", "--untracked-files=all"],
+                cwd=self.repo_path, capture_output=True, check=True
+            ).stdout.decode('utf-8', errors='surrogateescape')
+            
+            status = RepoStatus(branch="unknown", modified_files=[], untracked_files=[], staged_files=[])
+            entries = iter(out.split('\0'))
+            for entry in entries:
+                if entry.startswith("## "):
+                    status.branch = _branch_from_header(entry[3:])
+                    continue
+                if len(entry) < 4:
+                    continue
+                
+                x, y, path = entry[0], entry[1], entry[3:]
+                if x in "RC":
+                    next(entries, None)  # The rename/copy source follows as its own field
+                
+                if x == "?":
+                    status.untracked_files.append(path)
+                    continue
+                if x not in " !":
+                    status.staged_files.append(path)
+                if y not in " !":
+                    status.modified_files.append(path)
+            
+            self._status_cache = (now, status)
+            return status
         except Exception as e:
             logger.error(f"📁 Error getting repo status: {e}")
             return RepoStatus(branch="unknown", modified_files=[], untracked_files=[], staged_files=[])
@@ -308,6 +751,7 @@ memory/states/
         try:
             new_branch = self.repo.create_head(branch_name)
             new_branch.checkout()
+            self._status_cache = None
             logger.info(f"📁 Created and switched to branch: {branch_name}")
             return True
         except Exception as e:
@@ -320,6 +764,7 @@ memory/states/
             # Check if branch exists
             if branch_name in [b.name for b in self.repo.branches]:
                 self.repo.heads[branch_name].checkout()
+                self._status_cache = None
                 logger.info(f"📁 Switched to existing branch: {branch_name}")
                 return True
             elif create:
@@ -348,37 +793,65 @@ memory/states/
     
     def search_files(self, query: str, file_patterns: List[str] = None) -> List[Dict[str, Any]]:
         """Search for text in files"""
-        import re
-        
         results = []
         
         try:
+            # Compiled once for every file; MULTILINE keeps ^ and $ anchored per line
+            regex = re.compile(query, re.IGNORECASE | re.MULTILINE)
+            
             # Default to common code files if no patterns specified
             if not file_patterns:
                 file_patterns = ["*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.h", "*.md", "*.txt"]
             
-            # Get all matching files
+            # Get all matching files; dotfiles are searched, as Path.glob always did
             files_to_search = []
-            for pattern in file_patterns:
-                files_to_search.extend(self.repo_path.glob(f"**/{pattern}"))
-            
-            # Search in each file
-            for file_path in files_to_search:
-                if file_path.is_file():
-                    try:
-                        content = file_path.read_text(encoding='utf-8', errors='ignore')
-                        lines = content.split('\n')
-                        
-                        for line_num, line in enumerate(lines, 1):
-                            if re.search(query, line, re.IGNORECASE):
-                                results.append({
-                                    "file": str(file_path.relative_to(self.repo_path)),
-                                    "line": line_num,
-                                    "content": line.strip(),
-                                    "match": query
-                                })
-                    except Exception as e:
-                        logger.warning(f"📁 Error searching {file_path}: {e}")
+            listings: Dict[str, Any] = {}
+            for pattern in dict.fromkeys(file_patterns):
+                files_to_search.extend(self.repo_path / f for f in self._expand(f"**/{pattern}", listings, include_hidden=True))
+            files_to_search = list(dict.fromkeys(files_to_search))
+            
+            # Plain literals are located with str.find; Hyperscan scans each file as one
+            # buffer, and each thread needs its own scratch space
+            is_literal = bool(query) and _REGEX_METACHARS.isdisjoint(query)
+            if len(self._search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.clear()
+            database = _compile_hyperscan(query) if HYPERSCAN_AVAILABLE and not is_literal else None
+            scratches = threading.local()
+            
+            # Search files concurrently, keeping results in file order; an unchanged
+            # file reuses its matches from the last search for the same query
+            def scan(file_path: Path) -> List[Dict[str, Any]]:
+                cache_key = (query, str(file_path))
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    self._search_cache.pop(cache_key, None)  # Deleted - don't keep its matches
+                    return []
+                cached = self._search_cache.get(cache_key)
+                if cached is not None and cached[0] == _stat_key(st) and _is_settled(st):
+                    return [dict(match) for match in cached[1]]
+                
+                matches = search(file_path)
+                self._search_cache[cache_key] = (_stat_key(st), matches)
+                return [dict(match) for match in matches]
+            
+            def search(file_path: Path) -> List[Dict[str, Any]]:
+                if is_literal:
+                    return self._search_one_literal(file_path, regex, query)
+                if database is None:
+                    return self._search_one(file_path, regex, query)
+                if not hasattr(scratches, "scratch"):
+                    scratches.scratch = hyperscan.Scratch(database)
+                return self._search_one_hyperscan(file_path, database, scratches.scratch, regex, query)
+            
+            if len(files_to_search) > 1:
+                with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(files_to_search)),
+                                        thread_name_prefix="repo-search") as pool:
+                    for matches in pool.map(scan, files_to_search):
+                        results.extend(matches)
+            else:
+                for file_path in files_to_search:
+                    results.extend(scan(file_path))
             
             logger.info(f"📁 Found {len(results)} matches for '{query}'")
             return results
@@ -387,6 +860,150 @@ memory/states/
             logger.error(f"📁 Error in search: {e}")
             return []
 
+    def _search_one(self, file_path: Path, regex: "re.Pattern", query: str) -> List[Dict[str, Any]]:
+        """
+        Matching lines of one file, one entry per line.
+        
+        The regex runs over the whole text; lines are only located around
+        matches, so files without a match are never split. Lines still match
+        one at a time: a match that runs past the end of its line (\\s, [^x]
+        ... can consume the newline) only counts if the line matches on its own.
+        """
+        try:
+            content = file_path.read_bytes().decode('utf-8', errors='ignore')
+        except IsADirectoryError:
+            return []
+        except Exception as e:
+            logger.warning(f"📁 Error searching {file_path}: {e}")
+            return []
+        
+        matches = []
+        rel_path = str(file_path.relative_to(self.repo_path))
+        line_num, counted_to = 1, 0
+        match = regex.search(content)
+        
+        while match:
+            line_start = content.rfind('\n', 0, match.start()) + 1
+            line_end = content.find('\n', match.start())
+            if line_end == -1:
+                line_end = len(content)
+            
+            if match.end() <= line_end or regex.search(content, line_start, line_end):
+                line_num += content.count('\n', counted_to, line_start)
+                counted_to = line_start
+                matches.append({
+                    "file": rel_path,
+                    "line": line_num,
+                    "content": content[line_start:line_end].strip(),
+                    "match": query
+                })
+            
+            if line_end >= len(content):
+                break
+            match = regex.search(content, line_end + 1)  # Next line onwards
+        
+        return matches
+
+    def _search_one_literal(self, file_path: Path, regex: "re.Pattern", query: str) -> List[Dict[str, Any]]:
+        """
+        Matching lines of one file for a query with no regex metacharacters.
+        
+        Case-insensitive str.find (memmem) over the lowered text decides
+        whether the file matches at all and where; the regex is only needed
+        when lowering changes the text's length and offsets would drift.
+        """
+        try:
+            content = file_path.read_bytes().decode('utf-8', errors='ignore')
+        except IsADirectoryError:
+            return []
+        except Exception as e:
+            logger.warning(f"📁 Error searching {file_path}: {e}")
+            return []
+        
+        low, needle = content.lower(), query.lower()
+        pos = low.find(needle)
+        if pos == -1:
+            return []
+        if len(low) != len(content):
+            return self._search_one(file_path, regex, query)
+        
+        matches = []
+        rel_path = str(file_path.relative_to(self.repo_path))
+        line_num, line_start = 1, 0
+        
+        while pos != -1:
+            line_num += content.count('\n', line_start, pos)
+            line_start = content.rfind('\n', 0, pos) + 1
+            line_end = content.find('\n', pos)
+            if line_end == -1:
+                line_end = len(content)
+            
+            matches.append({
+                "file": rel_path,
+                "line": line_num,
+                "content": content[line_start:line_end].strip(),
+                "match": query
+            })
+            
+            if line_end >= len(content):
+                break
+            pos = low.find(needle, line_end + 1)  # Next line onwards
+        
+        return matches
+
+    def _search_one_hyperscan(self, file_path: Path, database: "hyperscan.Database",
+                              scratch: "hyperscan.Scratch", regex: "re.Pattern",
+                              query: str) -> List[Dict[str, Any]]:
+        """
+        Matching lines of one file from a single Hyperscan pass over its bytes
+        
+        Leftmost start-of-match can hide a shorter match inside a line behind
+        one that crosses a newline, so files with such a match go to the
+        per-line re scan instead.
+        """
+        try:
+            data = file_path.read_bytes()
+        except IsADirectoryError:
+            return []
+        except Exception as e:
+            logger.warning(f"📁 Error searching {file_path}: {e}")
+            return []
+        
+        # UTF8 mode requires valid UTF-8 - drop undecodable bytes as the re path does
+        if not data.isascii():
+            data = data.decode('utf-8', errors='ignore').encode('utf-8')
+        
+        spans = []
+        database.scan(data, match_event_handler=lambda _id, start, end, _flags, _ctx: spans.append((start, end)),
+                      scratch=scratch)
+        if not spans:
+            return []
+        if any(data.find(b'\n', start, end) != -1 for start, end in spans):
+            return self._search_one(file_path, regex, query)
+        starts = [start for start, _ in spans]
+        
+        matches = []
+        rel_path = str(file_path.relative_to(self.repo_path))
+        line_num, line_start, line_end = 1, 0, -1
+        
+        for start in sorted(starts):
+            if start <= line_end:
+                continue  # Another match on a line already reported
+            line_num += data.count(b'\n', line_start, start)
+            line_start = data.rfind(b'\n', 0, start) + 1
+            line_end = data.find(b'\n', start)
+            if line_end == -1:
+                line_end = len(data)
+            
+            matches.append({
+                "file": rel_path,
+                "line": line_num,
+                "content": data[line_start:line_end].decode('utf-8', errors='ignore').strip(),
+                "match": query
+            })
+        
+        return matches
+
 # Test the repo service
 def test_repo_service():
     """Test the repo service functionality"""
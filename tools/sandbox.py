@@ -6,19 +6,55 @@ Phase A: Docker-based isolated testing
 Provides secure, isolated environments for running tests and code analysis.
 """
 
+import asyncio
+import atexit
 import docker
-import subprocess
+import hashlib
+import io
+import tarfile
 import tempfile
 import json
 import time
 import os
+import shutil
+import signal
+import uuid
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 
+from tools.docker_api import DockerAPIError, DockerSocketClient, default_socket_path
+
 logger = logging.getLogger(__name__)
 
+# Pooled containers exit on their own after this long, so a pool that is never
+# closed can't leak them; a container is retired early if a command could outlive it
+POOL_CONTAINER_LIFETIME_SEC = 3600
+
+# Exit status of coreutils `timeout` when the command ran out of time
+_TIMEOUT_EXIT_CODES = (124, 137)
+
+# Output kept per stream from a container command; the rest is drained and dropped
+MAX_OUTPUT_BYTES = 16 * 1024 * 1024
+
+# Files whose presence decides how a project is tested and installed
+_PROJECT_MARKERS = frozenset({"pytest.ini", "pyproject.toml", "package.json", "requirements.txt"})
+
+# A directory modified this recently may change again within the same mtime tick
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Repository for images with a project's requirements preinstalled, tagged by content hash
+DEPENDENCY_IMAGE_REPO = "sandbox-deps"
+
+_DEPENDENCY_DOCKERFILE = """FROM {base}
+COPY requirements.txt /tmp/requirements.txt
+RUN pip install --no-cache-dir -r /tmp/requirements.txt
+"""
+
+# Either Docker client reporting a failed call
+_DOCKER_ERRORS = (docker.errors.APIError, DockerAPIError)
+
 @dataclass
 class SandboxResult:
     """Result from sandbox execution"""
@@ -59,6 +95,25 @@ class Sandbox:
             "ubuntu": "ubuntu:22.04"
         }
         
+        # Async Engine API client on the default daemon socket; docker-py (in worker
+        # threads) covers any other DOCKER_HOST
+        self._docker_api: Optional[DockerSocketClient] = None
+        if self.docker_available:
+            socket_path = default_socket_path()
+            if socket_path:
+                self._docker_api = DockerSocketClient(socket_path)
+        
+        # Long-lived containers commands are exec'd into, keyed by image, mount and limits:
+        # key -> (container id, start time)
+        self._container_pool: Dict[Tuple[str, ...], Tuple[str, float]] = {}
+        self._pool_lock = asyncio.Lock()
+        
+        # project path -> (directory mtime_ns, marker files present)
+        self._project_markers_cache: Dict[str, Tuple[int, frozenset]] = {}
+        
+        # Dependency image tags known to exist locally
+        self._dependency_images: set = set()
+        
         logger.info(f"🐳 Sandbox initialized (Docker available: {self.docker_available})")
     
     def _check_docker(self) -> bool:
@@ -125,14 +180,6 @@ class Sandbox:
                     error=f"Project path does not exist: {project_path}"
                 )
             
-            # Prepare volumes
-            volumes = {
-                str(project_path): {
-                    'bind': config.working_dir,
-                    'mode': 'rw'
-                }
-            }
-            
             # Prepare environment
             container_env = {
                 'PYTHONPATH': config.working_dir,
@@ -142,55 +189,41 @@ class Sandbox:
             
             logger.info(f"🐳 Running in Docker: {command}")
             
-            # Run container
-            container = self.docker_client.containers.run(
-                image=config.image,
-                command=f"bash -c '{command}'",
-                volumes=volumes,
-                working_dir=config.working_dir,
-                environment=container_env,
-                network_mode=config.network,
-                mem_limit=config.memory_limit,
-                cpu_count=int(config.cpu_limit),
-                detach=True,
-                remove=True,
-                user="1000:1000",  # Non-root user
-                cap_drop=["ALL"],   # Drop all capabilities
-                security_opt=["no-new-privileges:true"]
-            )
-            
-            # Wait for completion with timeout
+            # Exec into the pooled container for this image and project; the argv form
+            # needs no shell quoting, and `timeout` enforces the limit inside the container
+            container_id = await self._pooled_container(config, project_path)
+            argv = ["timeout", "-k", "5", str(config.timeout), "bash", "-c", command]
             try:
-                exit_code = container.wait(timeout=config.timeout)['StatusCode']
-                logs = container.logs(stdout=True, stderr=True).decode('utf-8', errors='ignore')
-                
-                # Split stdout and stderr (simplified)
-                stdout = logs
-                stderr = ""
-                
-                execution_time = time.time() - start_time
-                
+                exit_code, stdout_bytes, stderr_bytes = await self._exec(
+                    container_id, argv, container_env, config.working_dir
+                )
+            except _DOCKER_ERRORS:
+                # The container is gone (killed, or reached its lifetime) - start a fresh one
+                await self._discard_container(config, project_path)
+                container_id = await self._pooled_container(config, project_path)
+                exit_code, stdout_bytes, stderr_bytes = await self._exec(
+                    container_id, argv, container_env, config.working_dir
+                )
+            
+            execution_time = time.time() - start_time
+            
+            if exit_code in _TIMEOUT_EXIT_CODES and execution_time >= config.timeout:
                 return SandboxResult(
-                    success=exit_code == 0,
-                    exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
-                    execution_time=execution_time
+                    success=False,
+                    exit_code=-1,
+                    stdout=stdout_bytes.decode('utf-8', errors='ignore'),
+                    stderr="Command timed out",
+                    execution_time=execution_time,
+                    timeout=True
                 )
-                
-            except docker.errors.APIError as e:
-                if "timeout" in str(e).lower():
-                    container.kill()
-                    return SandboxResult(
-                        success=False,
-                        exit_code=-1,
-                        stdout="",
-                        stderr="Command timed out",
-                        execution_time=time.time() - start_time,
-                        timeout=True
-                    )
-                else:
-                    raise
+            
+            return SandboxResult(
+                success=exit_code == 0,
+                exit_code=exit_code,
+                stdout=stdout_bytes.decode('utf-8', errors='ignore'),
+                stderr=stderr_bytes.decode('utf-8', errors='ignore'),
+                execution_time=execution_time
+            )
             
         except Exception as e:
             logger.error(f"🐳 Docker execution error: {e}")
@@ -203,6 +236,149 @@ class Sandbox:
                 error=str(e)
             )
     
+    async def _exec(self, container_id: str, argv: List[str], environment: Dict[str, str],
+                    workdir: str) -> Tuple[int, bytes, bytes]:
+        """Exec a command in a pooled container: (exit code, stdout, stderr)"""
+        if self._docker_api is not None:
+            return await self._docker_api.exec_run(
+                container_id, argv, environment, workdir, "1000:1000", MAX_OUTPUT_BYTES
+            )
+        return await asyncio.to_thread(self._exec_streamed, container_id, argv, environment, workdir)
+    
+    def _exec_streamed(self, container_id: str, argv: List[str], environment: Dict[str, str],
+                       workdir: str) -> Tuple[int, bytes, bytes]:
+        """
+        Exec a command through docker-py, reading stdout and stderr as separate streams
+        
+        Chunks are appended as they arrive rather than buffered whole by the
+        client, and each stream keeps at most MAX_OUTPUT_BYTES.
+        """
+        api = self.docker_client.api
+        exec_id = api.exec_create(
+            container_id, argv, environment=environment, workdir=workdir, user="1000:1000"
+        )["Id"]
+        
+        stdout_buf, stderr_buf = bytearray(), bytearray()
+        for out, err in api.exec_start(exec_id, stream=True, demux=True):
+            if out and len(stdout_buf) < MAX_OUTPUT_BYTES:
+                stdout_buf += out[:MAX_OUTPUT_BYTES - len(stdout_buf)]
+            if err and len(stderr_buf) < MAX_OUTPUT_BYTES:
+                stderr_buf += err[:MAX_OUTPUT_BYTES - len(stderr_buf)]
+        
+        exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        return exit_code, bytes(stdout_buf), bytes(stderr_buf)
+    
+    def _pool_key(self, config: SandboxConfig, project_path: Path) -> Tuple[str, ...]:
+        """Commands may share a container only if it was started with the same settings"""
+        return (config.image, str(project_path), config.working_dir, config.network,
+                config.memory_limit, config.cpu_limit)
+    
+    async def _pooled_container(self, config: SandboxConfig, project_path: Path) -> str:
+        """Id of the running container for this image and project, started on first use"""
+        key = self._pool_key(config, project_path)
+        
+        async with self._pool_lock:
+            pooled = self._container_pool.get(key)
+            if pooled is not None:
+                container_id, started = pooled
+                if time.time() - started + config.timeout < POOL_CONTAINER_LIFETIME_SEC:
+                    return container_id
+                # Could expire mid-command - retire it
+                self._container_pool.pop(key)
+                await self._kill_container_async(container_id)
+            
+            logger.info(f"🐳 Starting pooled container: {config.image} for {project_path}")
+            container_id = await self._start_container(config, project_path)
+            if not self._container_pool:
+                atexit.register(self.close)
+            self._container_pool[key] = (container_id, time.time())
+            return container_id
+    
+    async def _start_container(self, config: SandboxConfig, project_path: Path) -> str:
+        """Start a hardened, idle container with the project mounted; returns its id"""
+        if self._docker_api is not None:
+            return await self._docker_api.run_container({
+                "Image": config.image,
+                "Cmd": ["sleep", str(POOL_CONTAINER_LIFETIME_SEC)],
+                "WorkingDir": config.working_dir,
+                "User": "1000:1000",  # Non-root user
+                "HostConfig": {
+                    "Binds": [f"{project_path}:{config.working_dir}:rw"],
+                    "NetworkMode": config.network,
+                    "Memory": docker.utils.parse_bytes(config.memory_limit),
+                    "CpuCount": int(config.cpu_limit),
+                    "AutoRemove": True,
+                    "Init": True,  # Reaps exec'd processes and lets the container stop promptly
+                    "CapDrop": ["ALL"],  # Drop all capabilities
+                    "SecurityOpt": ["no-new-privileges:true"]
+                }
+            })
+        
+        container = await asyncio.to_thread(
+            self.docker_client.containers.run,
+            image=config.image,
+            command=["sleep", str(POOL_CONTAINER_LIFETIME_SEC)],
+            volumes={
+                str(project_path): {
+                    'bind': config.working_dir,
+                    'mode': 'rw'
+                }
+            },
+            working_dir=config.working_dir,
+            network_mode=config.network,
+            mem_limit=config.memory_limit,
+            cpu_count=int(config.cpu_limit),
+            detach=True,
+            remove=True,
+            init=True,  # Reaps exec'd processes and lets the container stop promptly
+            user="1000:1000",  # Non-root user
+            cap_drop=["ALL"],   # Drop all capabilities
+            security_opt=["no-new-privileges:true"]
+        )
+        return container.id
+    
+    async def _discard_container(self, config: SandboxConfig, project_path: Path):
+        """Forget (and kill, if still running) the pooled container for this key"""
+        async with self._pool_lock:
+            pooled = self._container_pool.pop(self._pool_key(config, project_path), None)
+        if pooled is not None:
+            await self._kill_container_async(pooled[0])
+    
+    def _kill_container(self, container_id: str):
+        """Kill a pooled container; it was started with auto-remove, so it cleans itself up"""
+        try:
+            self.docker_client.api.kill(container_id)
+        except docker.errors.APIError:
+            pass  # Already gone
+    
+    async def _kill_container_async(self, container_id: str):
+        """Kill a pooled container without blocking the event loop"""
+        if self._docker_api is None:
+            await asyncio.to_thread(self._kill_container, container_id)
+            return
+        try:
+            await self._docker_api.kill(container_id)
+        except DockerAPIError:
+            pass  # Already gone
+    
+    def close(self):
+        """Kill every pooled container (synchronous, so it can run at exit)"""
+        pool, self._container_pool = self._container_pool, {}
+        for container_id, _ in pool.values():
+            self._kill_container(container_id)
+        if pool:
+            logger.info(f"🐳 Stopped {len(pool)} pooled containers")
+    
+    async def aclose(self):
+        """Kill every pooled container and close the socket session"""
+        atexit.unregister(self.close)  # Nothing left for the exit hook to do
+        pool, self._container_pool = self._container_pool, {}
+        await asyncio.gather(*(self._kill_container_async(container_id) for container_id, _ in pool.values()))
+        if pool:
+            logger.info(f"🐳 Stopped {len(pool)} pooled containers")
+        if self._docker_api is not None:
+            await self._docker_api.aclose()
+    
     async def _run_local(
         self,
         command: str,
@@ -220,19 +396,19 @@ class Sandbox:
             local_env.update(env)
             local_env['PYTHONPATH'] = project_path
             
-            # Run command with timeout
-            process = subprocess.Popen(
+            # Run command with timeout, without blocking the event loop; its own session
+            # lets a timeout kill everything the shell started
+            process = await asyncio.create_subprocess_shell(
                 command,
-                shell=True,
                 cwd=project_path,
                 env=local_env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
             )
             
             try:
-                stdout, stderr = process.communicate(timeout=config.timeout)
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=config.timeout)
                 exit_code = process.returncode
                 
                 execution_time = time.time() - start_time
@@ -240,13 +416,14 @@ class Sandbox:
                 return SandboxResult(
                     success=exit_code == 0,
                     exit_code=exit_code,
-                    stdout=stdout,
-                    stderr=stderr,
+                    stdout=stdout.decode('utf-8', errors='ignore'),
+                    stderr=stderr.decode('utf-8', errors='ignore'),
                     execution_time=execution_time
                 )
                 
-            except subprocess.TimeoutExpired:
-                process.kill()
+            except asyncio.TimeoutError:
+                self._kill_process_tree(process)
+                await process.wait()
                 return SandboxResult(
                     success=False,
                     exit_code=-1,
@@ -267,21 +444,126 @@ class Sandbox:
                 error=str(e)
             )
     
+    @staticmethod
+    def _kill_process_tree(process: asyncio.subprocess.Process):
+        """Kill a local command's shell and everything it started"""
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass  # Already exited
+    
+    async def run_batch(
+        self,
+        commands: List[str],
+        project_path: str,
+        config: SandboxConfig = None
+    ) -> List[SandboxResult]:
+        """
+        Run independent commands concurrently inside a single sandbox invocation
+        
+        Container/process startup is paid once. Each command runs in the
+        background of one shell script with its output and exit code captured
+        to files under the project, which are split back into one result per
+        command (in the order given) and removed afterwards.
+        """
+        batch_name = f".sandbox-batch-{uuid.uuid4().hex[:8]}"
+        batch_dir = Path(project_path) / batch_name
+        
+        try:
+            batch_dir.mkdir(parents=True)
+            batch_dir.chmod(0o777)  # The container runs as an unprivileged user
+            
+            script = [
+                f"( ( {command}\n) >{batch_name}/{i}.out 2>{batch_name}/{i}.err </dev/null; echo $? >{batch_name}/{i}.rc ) &"
+                for i, command in enumerate(commands)
+            ]
+            script.append("wait")
+            (batch_dir / "run.sh").write_text("\n".join(script) + "\n")
+            
+            logger.info(f"🐳 Running batch of {len(commands)} commands")
+            batch_result = await self.run_command(f"sh {batch_name}/run.sh", project_path, config)
+            
+            results = []
+            for i in range(len(commands)):
+                try:
+                    exit_code = int((batch_dir / f"{i}.rc").read_text().strip())
+                except (OSError, ValueError):
+                    # Never finished - the batch timed out or failed to start
+                    results.append(SandboxResult(
+                        success=False,
+                        exit_code=-1,
+                        stdout="",
+                        stderr=batch_result.stderr,
+                        execution_time=batch_result.execution_time,
+                        timeout=batch_result.timeout,
+                        error=batch_result.error or "Command did not complete"
+                    ))
+                    continue
+                
+                results.append(SandboxResult(
+                    success=exit_code == 0,
+                    exit_code=exit_code,
+                    stdout=(batch_dir / f"{i}.out").read_text(errors='ignore'),
+                    stderr=(batch_dir / f"{i}.err").read_text(errors='ignore'),
+                    execution_time=batch_result.execution_time
+                ))
+            
+            return results
+            
+        except OSError as e:
+            logger.error(f"🐳 Batch setup error: {e}")
+            return [
+                SandboxResult(success=False, exit_code=-1, stdout="", stderr="", execution_time=0, error=str(e))
+                for _ in commands
+            ]
+        finally:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+    
+    def _project_markers(self, project_path: str) -> frozenset:
+        """
+        Which dependency/test marker files the project root holds
+        
+        Cached until the directory's mtime changes - adding, removing or
+        renaming an entry always bumps it.
+        """
+        try:
+            mtime_ns = os.stat(project_path).st_mtime_ns
+        except OSError:
+            return frozenset()
+        
+        cached = self._project_markers_cache.get(project_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        try:
+            with os.scandir(project_path) as entries:
+                markers = frozenset(e.name for e in entries if e.name in _PROJECT_MARKERS and not e.is_dir())
+        except OSError:
+            return frozenset()
+        
+        # Not cached while the directory may still change within the same mtime tick
+        if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+            self._project_markers_cache[project_path] = (mtime_ns, markers)
+        return markers
+    
     async def run_tests(self, project_path: str, test_command: str = None) -> SandboxResult:
         """Run tests in the project"""
         if test_command is None:
             # Auto-detect test command
-            project_path_obj = Path(project_path)
+            markers = self._project_markers(project_path)
             
-            if (project_path_obj / "pytest.ini").exists() or (project_path_obj / "pyproject.toml").exists():
+            if "pytest.ini" in markers or "pyproject.toml" in markers:
                 test_command = "python -m pytest -v"
-            elif (project_path_obj / "package.json").exists():
+            elif "package.json" in markers:
                 test_command = "npm test"
             else:
                 test_command = "python -m pytest -v"  # Default
         
         config = SandboxConfig(
-            image=self.images["python"],
+            image=self._python_image(project_path),
             timeout=300  # 5 minutes for tests
         )
         
@@ -289,68 +571,80 @@ class Sandbox:
     
     async def run_static_analysis(self, project_path: str, targets: List[str]) -> Dict[str, SandboxResult]:
         """Run static analysis tools"""
-        results = {}
+        # Tool name -> (command, image); the tools are independent, so they run concurrently
+        commands = {}
         
         # Python static analysis
         if any(target.endswith('.py') for target in targets):
             # MyPy type checking
-            mypy_result = await self.run_command(
-                f"python -m mypy {' '.join(targets)}",
-                project_path,
-                SandboxConfig(image=self.images["python"])
-            )
-            results["mypy"] = mypy_result
+            commands["mypy"] = (f"python -m mypy {' '.join(targets)}", self.images["python"])
             
             # Ruff linting
-            ruff_result = await self.run_command(
-                f"python -m ruff check {' '.join(targets)}",
-                project_path,
-                SandboxConfig(image=self.images["python"])
-            )
-            results["ruff"] = ruff_result
+            commands["ruff"] = (f"python -m ruff check {' '.join(targets)}", self.images["python"])
             
             # Bandit security analysis
-            bandit_result = await self.run_command(
-                f"python -m bandit -r {' '.join(targets)}",
-                project_path,
-                SandboxConfig(image=self.images["python"])
-            )
-            results["bandit"] = bandit_result
+            commands["bandit"] = (f"python -m bandit -r {' '.join(targets)}", self.images["python"])
         
         # JavaScript/TypeScript static analysis
         js_files = [t for t in targets if t.endswith(('.js', '.ts'))]
         if js_files:
             # ESLint
-            eslint_result = await self.run_command(
-                f"npx eslint {' '.join(js_files)}",
-                project_path,
-                SandboxConfig(image=self.images["node"])
-            )
-            results["eslint"] = eslint_result
+            commands["eslint"] = (f"npx eslint {' '.join(js_files)}", self.images["node"])
             
             # TypeScript compiler
             if any(f.endswith('.ts') for f in js_files):
-                tsc_result = await self.run_command(
-                    "npx tsc --noEmit",
-                    project_path,
-                    SandboxConfig(image=self.images["node"])
+                commands["typescript"] = ("npx tsc --noEmit", self.images["node"])
+        
+        # Each run gets cpu_limit CPUs - don't start more than the host can hold at once
+        config_cpus = int(SandboxConfig().cpu_limit)
+        semaphore = asyncio.Semaphore(max(1, (os.cpu_count() or 1) // config_cpus))
+        
+        async def run_tool(command: str, image: str) -> SandboxResult:
+            async with semaphore:
+                return await self.run_command(command, project_path, SandboxConfig(image=image))
+        
+        start_time = time.time()
+        done = await asyncio.gather(
+            *(run_tool(command, image) for command, image in commands.values()),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for tool, result in zip(commands, done):
+            if isinstance(result, Exception):
+                result = SandboxResult(
+                    success=False,
+                    exit_code=-1,
+                    stdout="",
+                    stderr="",
+                    execution_time=time.time() - start_time,
+                    error=str(result)
                 )
-                results["typescript"] = tsc_result
+            results[tool] = result
         
         return results
     
     async def install_dependencies(self, project_path: str) -> SandboxResult:
         """Install project dependencies"""
-        project_path_obj = Path(project_path)
+        markers = self._project_markers(project_path)
         
-        # Python project
-        if (project_path_obj / "requirements.txt").exists():
+        # Python project - an image with these exact requirements installed makes pip unnecessary
+        if "requirements.txt" in markers:
+            tag = await self.prepare_dependency_image(project_path)
+            if tag is not None:
+                return SandboxResult(
+                    success=True,
+                    exit_code=0,
+                    stdout=f"Dependencies preinstalled in {tag}",
+                    stderr="",
+                    execution_time=0
+                )
             return await self.run_command(
                 "pip install -r requirements.txt",
                 project_path,
                 SandboxConfig(image=self.images["python"], timeout=300)
             )
-        elif (project_path_obj / "pyproject.toml").exists():
+        elif "pyproject.toml" in markers:
             return await self.run_command(
                 "pip install -e .",
                 project_path,
@@ -358,7 +652,7 @@ class Sandbox:
             )
         
         # Node.js project
-        elif (project_path_obj / "package.json").exists():
+        elif "package.json" in markers:
             return await self.run_command(
                 "npm install",
                 project_path,
@@ -375,6 +669,75 @@ class Sandbox:
                 error="No requirements.txt, pyproject.toml, or package.json found"
             )
     
+    def _dependency_image_tag(self, requirements: bytes) -> str:
+        """Tag of the dependency image for these requirements.txt contents"""
+        digest = hashlib.blake2b(self.images["python"].encode() + b"\0" + requirements, digest_size=8)
+        return f"{DEPENDENCY_IMAGE_REPO}:{digest.hexdigest()}"
+    
+    def _python_image(self, project_path: str) -> str:
+        """The project's dependency image if it has been built, else the base Python image"""
+        if self.docker_available and self._dependency_images:
+            try:
+                requirements = (Path(project_path) / "requirements.txt").read_bytes()
+            except OSError:
+                return self.images["python"]
+            tag = self._dependency_image_tag(requirements)
+            if tag in self._dependency_images:
+                return tag
+        return self.images["python"]
+    
+    async def prepare_dependency_image(self, project_path: str) -> Optional[str]:
+        """
+        Ensure an image with the project's requirements.txt installed exists
+        
+        Images are tagged by a hash of the base image and requirements, so an
+        unchanged requirements.txt reuses the earlier build instead of running
+        pip again. Returns the tag, or None if Docker or the build is unavailable.
+        """
+        if not self.docker_available:
+            return None
+        
+        try:
+            requirements = (Path(project_path) / "requirements.txt").read_bytes()
+        except OSError:
+            return None
+        tag = self._dependency_image_tag(requirements)
+        if tag in self._dependency_images:
+            return tag
+        
+        try:
+            await asyncio.to_thread(self.docker_client.images.get, tag)
+            logger.info(f"🐳 Reusing dependency image: {tag}")
+        except docker.errors.ImageNotFound:
+            logger.info(f"🐳 Building dependency image: {tag}")
+            try:
+                await asyncio.to_thread(self._build_dependency_image, requirements, tag)
+            except Exception as e:
+                logger.warning(f"🐳 Could not build dependency image, installing in the sandbox: {e}")
+                return None
+        except Exception as e:
+            logger.warning(f"🐳 Could not look up dependency image: {e}")
+            return None
+        
+        self._dependency_images.add(tag)
+        return tag
+    
+    def _build_dependency_image(self, requirements: bytes, tag: str):
+        """Build the dependency image from an in-memory context: Dockerfile + requirements.txt"""
+        context = io.BytesIO()
+        with tarfile.open(fileobj=context, mode="w") as tar:
+            files = {
+                "Dockerfile": _DEPENDENCY_DOCKERFILE.format(base=self.images["python"]).encode(),
+                "requirements.txt": requirements
+            }
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        context.seek(0)
+        
+        self.docker_client.images.build(fileobj=context, custom_context=True, tag=tag, rm=True)
+    
     def prepare_sandbox_image(self, image_name: str, dockerfile_content: str = None):
         """Prepare a custom sandbox image"""
         if not self.docker_available:
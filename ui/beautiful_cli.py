@@ -5,40 +5,63 @@ Using Rich library for professional terminal experience
 """
 
 import asyncio
+import atexit
+import hashlib
+import os
+import sys
 import time
-from datetime import datetime
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence, Tuple, Union
 
+# Progress, Syntax (which pulls in Pygments) and Layout are imported where first
+# used, so short runs that never show them skip that import time
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-    from rich.syntax import Syntax
     from rich.table import Table
     from rich.text import Text
-    from rich.live import Live
-    from rich.layout import Layout
     from rich.align import Align
+    from rich.segment import Segments
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
     # Fallback to basic colors
     from ui.basic_colors import Colors
 
-class BeautifulCLI:
-    """Enhanced CLI with beautiful Rich-based interface"""
-    
-    def __init__(self):
-        if RICH_AVAILABLE:
-            self.console = Console()
-        else:
-            self.console = None
-    
-    def show_banner(self):
-        """Display the awesome startup banner"""
-        if RICH_AVAILABLE:
-            banner_text = """
+if TYPE_CHECKING:
+    from rich.layout import Layout
+    from rich.progress import Progress
+
+# Highlighted code panels kept for re-display
+_CODE_CACHE_SIZE = 128
+
+_PHASE_ICONS = MappingProxyType({
+    "INIT": "🏗️",
+    "ENV_SCAN": "🔍",
+    "REQS": "📋",
+    "ENV_SETUP": "⚙️",
+    "FE": "🎨",
+    "BE": "🔧",
+    "TEST": "🧪",
+    "DEPLOY": "🚀",
+    "FINAL": "📝"
+})
+
+# Fixed rows of the environment scan and test result tables
+_ENV_TOOL_ROWS: Tuple[Tuple[str, str, str], ...] = (
+    ("🐍 Python", "✅ Available", "3.11.0"),
+    ("📦 Node.js", "✅ Available", "18.17.0"),
+)
+_TEST_RESULT_ROWS: Tuple[Tuple[str, str, str], ...] = (
+    ("Backend API", "✅ Passed", "15/15 tests"),
+    ("Frontend Unit", "✅ Passed", "8/8 tests"),
+    ("Integration", "✅ Passed", "5/5 tests"),
+    ("Security", "✅ Passed", "3/3 tests"),
+)
+
+_BANNER_TEXT = """
 🤖 AUTONOMOUS AI DEVELOPER
 
 The world's first fully autonomous AI software development system!
@@ -53,138 +76,291 @@ The world's first fully autonomous AI software development system!
 
 🎯 JUST DESCRIBE WHAT YOU WANT - AI BUILDS IT COMPLETELY!
             """
-            
-            panel = Panel(
-                banner_text,
-                title="[bold cyan]Welcome to the Future of AI Development[/bold cyan]",
-                border_style="bright_cyan",
-                padding=(1, 2)
-            )
-            self.console.print(panel)
+
+if RICH_AVAILABLE:
+    # Static markup is parsed once here rather than by console.print on every call
+    _BANNER_PANEL = Panel(
+        Text.from_markup(_BANNER_TEXT),
+        title=Text.from_markup("[bold cyan]Welcome to the Future of AI Development[/bold cyan]"),
+        border_style="bright_cyan",
+        padding=(1, 2)
+    )
+    
+    _COMPLETION_TITLE = Text.from_markup("[bold green]🎉 Success![/bold green]")
+    _PROJECT_START_TITLE = Text("🚀 Project Initialization", style="table.title")
+else:
+    # Fallback output: fixed lines are coloured once here, the rest fill in prebuilt
+    # templates rather than re-interpolating the colour codes on every call
+    _FALLBACK_BANNER = (
+        f"{Colors.BRIGHT_CYAN}🤖 AUTONOMOUS AI DEVELOPER{Colors.RESET}",
+        f"{Colors.BRIGHT_YELLOW}The world's first fully autonomous AI software development system!{Colors.RESET}"
+    )
+    _FALLBACK_ENV_SCAN = (
+        f"\n{Colors.BRIGHT_GREEN}✅ Environment scan completed:{Colors.RESET}",
+        f"   {Colors.GREEN}🐍 Python 3.11.0 - Available{Colors.RESET}",
+        f"   {Colors.GREEN}📦 Node.js 18.17.0 - Available{Colors.RESET}",
+        f"   {Colors.GREEN}🌐 Frontend Port: 5173{Colors.RESET}",
+        f"   {Colors.GREEN}🔧 Backend Port: 8000{Colors.RESET}"
+    )
+    _FALLBACK_TEST_RESULTS = (
+        f"\n{Colors.BRIGHT_GREEN}🧪 Test Results:{Colors.RESET}",
+        f"   {Colors.GREEN}✅ Backend API tests: 15/15 passed{Colors.RESET}",
+        f"   {Colors.GREEN}✅ Frontend unit tests: 8/8 passed{Colors.RESET}",
+        f"   {Colors.GREEN}✅ Integration tests: 5/5 passed{Colors.RESET}",
+        f"   {Colors.GREEN}✅ Security tests: 3/3 passed{Colors.RESET}"
+    )
+    _FALLBACK_PROJECT_START = "\n".join([
+        f"{Colors.BRIGHT_GREEN}🚀 Starting autonomous development...{Colors.RESET}",
+        f"{Colors.CYAN}📝 Requirements: {{}}{Colors.RESET}",
+        f"{Colors.CYAN}📁 Project: {{}}{Colors.RESET}",
+        f"{Colors.CYAN}💻 Language: {{}}{Colors.RESET}"
+    ]).format
+    _FALLBACK_PHASE = "\n".join([
+        f"\n{Colors.BRIGHT_CYAN}📍 Current Phase:{Colors.RESET} {Colors.BRIGHT_WHITE}{{}}{Colors.RESET}",
+        f"{Colors.BRIGHT_YELLOW}{{}} {{}}{Colors.RESET}",
+        f"{Colors.BRIGHT_BLUE}Progress:{Colors.RESET} {{}} {Colors.BRIGHT_WHITE}{{:.1f}}%{Colors.RESET}"
+    ]).format
+    _MONITOR_RULE = "=" * 60
+    
+    # Every fallback progress bar, indexed by filled cells (0-40)
+    _BARS = tuple(
+        f"{Colors.BRIGHT_GREEN}{'█' * filled}{Colors.BRIGHT_BLACK}{'░' * (40 - filled)}{Colors.RESET}"
+        for filled in range(41)
+    )
+    _FALLBACK_CODE_TITLE = f"\n{Colors.BRIGHT_BLUE}📄 {{}}{Colors.RESET}".format
+    _FALLBACK_CODE_RULE = f"{Colors.BRIGHT_BLACK}{'─' * 60}{Colors.RESET}"
+    
+    # Line-number gutters for code listings (index 0 is line 1), grown to the longest
+    # listing seen; blank lines get a bare number - no colour codes around nothing
+    _LINENO: List[str] = []
+    _LINENO_BLANK: List[str] = []
+    
+    def _grow_linenos(count: int):
+        """Make sure gutters exist for lines 1..count"""
+        for i in range(len(_LINENO) + 1, count + 1):
+            _LINENO.append(f"{Colors.DIM}{i:3d}{Colors.RESET} │ ")
+            _LINENO_BLANK.append(f"{i:3d} │")
+    _FALLBACK_COMPLETION = "\n".join([
+        f"\n{Colors.BRIGHT_GREEN}🎉 PROJECT COMPLETED SUCCESSFULLY!{Colors.RESET}",
+        f"{Colors.BRIGHT_CYAN}📁 Location: {{path}}{Colors.RESET}",
+        f"{Colors.BRIGHT_CYAN}🔄 Total iterations: {{iterations}}{Colors.RESET}",
+        f"{Colors.BRIGHT_CYAN}✅ All tests passing{Colors.RESET}",
+        
+        f"\n{Colors.BRIGHT_YELLOW}🚀 NEXT STEPS:{Colors.RESET}",
+        f"{Colors.YELLOW}1. cd {{path}}{Colors.RESET}",
+        f"{Colors.YELLOW}2. pip install -r requirements.txt{Colors.RESET}",
+        f"{Colors.YELLOW}3. python main.py{Colors.RESET}",
+        f"{Colors.YELLOW}4. Open http://localhost:5173 in your browser{Colors.RESET}",
+        
+        f"\n{Colors.BRIGHT_MAGENTA}✨ Your AI-built application is ready to use!{Colors.RESET}"
+    ]).format
+
+def _write_lines(lines: Sequence[str]):
+    """Fallback output: one write and one flush for a whole block of lines"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+class BeautifulCLI:
+    """Enhanced CLI with beautiful Rich-based interface"""
+    
+    def __init__(self):
+        if RICH_AVAILABLE:
+            self.console = Console()
+        else:
+            self.console = None
+            # The fallback flushes once per block itself, so the console needn't flush per line
+            if os.name == "nt" and hasattr(sys.stdout, "reconfigure"):
+                sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        
+        # LRU of rendered code blocks keyed by (code digest, language, title, width):
+        # Rich segments of the highlighted panel, or the numbered text in the fallback
+        self._code_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        
+        # One progress display for the whole run (started on first use) holding a single
+        # bar for the current phase; it is reset when the next phase starts
+        self._progress: Optional["Progress"] = None
+        self._phase_task: Optional[Any] = None
+        self._current_phase: Optional[str] = None
+        
+        # Last (phase, description, progress) shown; repeats of it are skipped
+        self._last_phase_state: Optional[Tuple[str, str, float]] = None
+        
+        # Rendered segments of tables with fixed contents, keyed by (table, inputs, width)
+        self._table_cache: Dict[tuple, list] = {}
+        
+        # Live monitor layout; only its body changes between frames
+        self._monitor_layout: Optional["Layout"] = None
+        
+        # Monitor clock text, reformatted only when the second changes
+        self._last_sec = -1
+        self._time_str = ""
+    
+    def show_banner(self):
+        """Display the awesome startup banner"""
+        if RICH_AVAILABLE:
+            self.console.print(_BANNER_PANEL)
         else:
             # Fallback banner
-            print(f"{Colors.BRIGHT_CYAN}🤖 AUTONOMOUS AI DEVELOPER{Colors.RESET}")
-            print(f"{Colors.BRIGHT_YELLOW}The world's first fully autonomous AI software development system!{Colors.RESET}")
+            _write_lines(_FALLBACK_BANNER)
     
     def show_project_start(self, requirements: str, project_name: str, language: str):
         """Show project startup information"""
         if RICH_AVAILABLE:
-            table = Table(title="🚀 Project Initialization", show_header=False, box=None)
+            # A plain key/value grid; the title sits above it as its own line
+            table = Table.grid(padding=(0, 1))
             table.add_row("📝 Requirements:", requirements)
             table.add_row("📁 Project:", project_name)
             table.add_row("💻 Language:", language)
             
-            panel = Panel(table, border_style="green")
+            panel = Panel(Group(_PROJECT_START_TITLE, table), border_style="green")
             self.console.print(panel)
         else:
-            print(f"{Colors.BRIGHT_GREEN}🚀 Starting autonomous development...{Colors.RESET}")
-            print(f"{Colors.CYAN}📝 Requirements: {requirements}{Colors.RESET}")
-            print(f"{Colors.CYAN}📁 Project: {project_name}{Colors.RESET}")
-            print(f"{Colors.CYAN}💻 Language: {language}{Colors.RESET}")
+            _write_lines([_FALLBACK_PROJECT_START(requirements, project_name, language)])
     
     def show_phase_progress(self, phase: str, description: str, progress: float):
         """Display current phase with progress"""
-        phase_icons = {
-            "INIT": "🏗️",
-            "ENV_SCAN": "🔍", 
-            "REQS": "📋",
-            "ENV_SETUP": "⚙️",
-            "FE": "🎨",
-            "BE": "🔧",
-            "TEST": "🧪",
-            "DEPLOY": "🚀",
-            "FINAL": "📝"
-        }
+        state = (phase, description, round(progress, 1))
+        if state == self._last_phase_state:
+            return
+        self._last_phase_state = state
         
-        icon = phase_icons.get(phase, "🔄")
+        icon = _PHASE_ICONS.get(phase, "🔄")
         
         if RICH_AVAILABLE:
-            # Create a progress bar
-            with Progress(
+            # Update the bar in place; the live display repaints it on its own. A new phase
+            # resets the bar, so finished phases don't linger on screen with live spinners
+            progress_bar = self._get_progress()
+            if self._phase_task is None:
+                self._phase_task = progress_bar.add_task(
+                    f"{icon} {description}", total=100, completed=progress
+                )
+            else:
+                if phase != self._current_phase:
+                    progress_bar.reset(self._phase_task)
+                # update() (unlike reset) marks the task finished at 100, stopping its spinner
+                progress_bar.update(self._phase_task, description=f"{icon} {description}", completed=progress)
+            self._current_phase = phase
+        else:
+            # Simple progress bar
+            filled = min(max(int(40 * progress / 100), 0), 40)
+            _write_lines([_FALLBACK_PHASE(phase, icon, description, _BARS[filled], progress)])
+    
+    def _get_progress(self) -> "Progress":
+        """The shared progress display, started on first use"""
+        if self._progress is None:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+            self._progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TaskProgressColumn(),
                 console=self.console
-            ) as progress_bar:
-                task = progress_bar.add_task(f"{icon} {description}", total=100)
-                progress_bar.update(task, completed=progress)
-                time.sleep(0.5)  # Brief pause to show the progress
-        else:
-            print(f"\n{Colors.BRIGHT_CYAN}📍 Current Phase:{Colors.RESET} {Colors.BRIGHT_WHITE}{phase}{Colors.RESET}")
-            print(f"{Colors.BRIGHT_YELLOW}{icon} {description}{Colors.RESET}")
-            # Simple progress bar
-            filled = int(40 * progress / 100)
-            bar = f"{Colors.BRIGHT_GREEN}{'█' * filled}{Colors.BRIGHT_BLACK}{'░' * (40 - filled)}{Colors.RESET}"
-            print(f"{Colors.BRIGHT_BLUE}Progress:{Colors.RESET} {bar} {Colors.BRIGHT_WHITE}{progress:.1f}%{Colors.RESET}")
+            )
+            self._progress.start()
+            atexit.register(self.close)  # Restore the cursor even if close() is never called
+        return self._progress
+    
+    def close(self):
+        """Stop the progress display"""
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
+            self._phase_task = None
+            self._current_phase = None
     
     def show_code_generation(self, language: str, code: str, title: str = "Generated Code"):
         """Display generated code with beautiful syntax highlighting"""
+        # Lexing dominates the cost, so a block shown before is replayed from its rendering
+        digest = hashlib.blake2b(code.encode('utf-8'), digest_size=8).digest()
+        
         if RICH_AVAILABLE:
-            syntax = Syntax(code, language, theme="monokai", line_numbers=True)
-            panel = Panel(
-                syntax,
-                title=f"[bold blue]📄 {title}[/bold blue]",
-                border_style="blue"
-            )
-            self.console.print(panel)
+            cache_key = (digest, language, title, self.console.width)
+            segments = self._cached_code(cache_key)
+            if segments is None:
+                from rich.syntax import Syntax
+                syntax = Syntax(code, language, theme="monokai", line_numbers=True)
+                panel = Panel(
+                    syntax,
+                    title=f"[bold blue]📄 {title}[/bold blue]",
+                    border_style="blue"
+                )
+                segments = list(self.console.render(panel))
+                self._cache_code(cache_key, segments)
+            self.console.print(Segments(segments))
         else:
             # Fallback to basic highlighting
-            print(f"\n{Colors.BRIGHT_BLUE}📄 {title}{Colors.RESET}")
-            print(f"{Colors.BRIGHT_BLACK}{'─' * 60}{Colors.RESET}")
-            
-            lines = code.split('\n')
-            for i, line in enumerate(lines, 1):
-                line_num = f"{Colors.DIM}{i:3d}{Colors.RESET}"
-                print(f"{line_num} │ {line}")
+            cache_key = (digest, None, None, None)
+            numbered = self._cached_code(cache_key)
+            if numbered is None:
+                lines = code.splitlines()
+                _grow_linenos(len(lines))
+                numbered = "\n".join(
+                    _LINENO[i] + line if line.strip() else _LINENO_BLANK[i]
+                    for i, line in enumerate(lines)
+                )
+                self._cache_code(cache_key, numbered)
             
-            print(f"{Colors.BRIGHT_BLACK}{'─' * 60}{Colors.RESET}")
+            _write_lines([_FALLBACK_CODE_TITLE(title), _FALLBACK_CODE_RULE, numbered, _FALLBACK_CODE_RULE])
+    
+    def _cached_code(self, cache_key: tuple) -> Any:
+        """A rendered code block from the LRU, or None"""
+        cached = self._code_cache.get(cache_key)
+        if cached is not None:
+            self._code_cache.move_to_end(cache_key)
+        return cached
+    
+    def _cache_code(self, cache_key: tuple, rendered: Any):
+        """Remember a rendered code block, evicting the least recently shown"""
+        self._code_cache[cache_key] = rendered
+        if len(self._code_cache) > _CODE_CACHE_SIZE:
+            self._code_cache.popitem(last=False)
     
     def show_environment_scan(self, env_data: Dict[str, Any]):
         """Display environment scan results"""
         if RICH_AVAILABLE:
-            table = Table(title="🔍 Environment Scan Results", show_header=True)
-            table.add_column("Component", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Version/Info", style="yellow")
-            
-            # Add environment data
-            capabilities = env_data.get('capabilities', {})
-            ports = env_data.get('available_ports', {})
+            ports: Dict[str, Union[int, str]] = env_data.get('available_ports', {})
+            frontend, backend = f"{ports.get('frontend', 5173)}", f"{ports.get('backend', 8000)}"
             
-            table.add_row("🐍 Python", "✅ Available", "3.11.0")
-            table.add_row("📦 Node.js", "✅ Available", "18.17.0")
-            table.add_row("🌐 Frontend Port", "✅ Ready", str(ports.get('frontend', '5173')))
-            table.add_row("🔧 Backend Port", "✅ Ready", str(ports.get('backend', '8000')))
+            def build() -> "Table":
+                table = Table(title="🔍 Environment Scan Results", show_header=True)
+                table.add_column("Component", style="cyan")
+                table.add_column("Status", style="green")
+                table.add_column("Version/Info", style="yellow")
+                
+                for row in _ENV_TOOL_ROWS:
+                    table.add_row(*row)
+                table.add_row("🌐 Frontend Port", "✅ Ready", frontend)
+                table.add_row("🔧 Backend Port", "✅ Ready", backend)
+                return table
             
-            self.console.print(table)
+            self._print_cached_table(("env_scan", frontend, backend), build)
         else:
-            print(f"\n{Colors.BRIGHT_GREEN}✅ Environment scan completed:{Colors.RESET}")
-            print(f"   {Colors.GREEN}🐍 Python 3.11.0 - Available{Colors.RESET}")
-            print(f"   {Colors.GREEN}📦 Node.js 18.17.0 - Available{Colors.RESET}")
-            print(f"   {Colors.GREEN}🌐 Frontend Port: 5173{Colors.RESET}")
-            print(f"   {Colors.GREEN}🔧 Backend Port: 8000{Colors.RESET}")
+            _write_lines(_FALLBACK_ENV_SCAN)
     
     def show_test_results(self, test_results: Dict[str, Any]):
         """Display test execution results"""
         if RICH_AVAILABLE:
-            table = Table(title="🧪 Test Results", show_header=True)
-            table.add_column("Test Suite", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Results", style="yellow")
+            def build() -> "Table":
+                table = Table(title="🧪 Test Results", show_header=True)
+                table.add_column("Test Suite", style="cyan")
+                table.add_column("Status", style="green")
+                table.add_column("Results", style="yellow")
+                
+                for row in _TEST_RESULT_ROWS:
+                    table.add_row(*row)
+                return table
             
-            table.add_row("Backend API", "✅ Passed", "15/15 tests")
-            table.add_row("Frontend Unit", "✅ Passed", "8/8 tests")
-            table.add_row("Integration", "✅ Passed", "5/5 tests")
-            table.add_row("Security", "✅ Passed", "3/3 tests")
-            
-            self.console.print(table)
+            self._print_cached_table(("test_results",), build)
         else:
-            print(f"\n{Colors.BRIGHT_GREEN}🧪 Test Results:{Colors.RESET}")
-            print(f"   {Colors.GREEN}✅ Backend API tests: 15/15 passed{Colors.RESET}")
-            print(f"   {Colors.GREEN}✅ Frontend unit tests: 8/8 passed{Colors.RESET}")
-            print(f"   {Colors.GREEN}✅ Integration tests: 5/5 passed{Colors.RESET}")
-            print(f"   {Colors.GREEN}✅ Security tests: 3/3 passed{Colors.RESET}")
+            _write_lines(_FALLBACK_TEST_RESULTS)
+    
+    def _print_cached_table(self, key: tuple, build):
+        """Print a table whose contents depend only on `key`, rendering it once per console width"""
+        cache_key = key + (self.console.width,)
+        segments = self._table_cache.get(cache_key)
+        if segments is None:
+            segments = self._table_cache[cache_key] = list(self.console.render(build()))
+        self.console.print(Segments(segments))
     
     def show_completion(self, project_path: str, iterations: int):
         """Display project completion celebration"""
@@ -205,30 +381,21 @@ The world's first fully autonomous AI software development system!
 ✨ Your AI-built application is ready to use!
             """
             
+            # Plain text - no markup to parse (and brackets in the path print as-is)
             panel = Panel(
-                completion_text,
-                title="[bold green]🎉 Success![/bold green]",
+                Text(completion_text),
+                title=_COMPLETION_TITLE,
                 border_style="bright_green",
                 padding=(1, 2)
             )
             self.console.print(panel)
         else:
-            print(f"\n{Colors.BRIGHT_GREEN}🎉 PROJECT COMPLETED SUCCESSFULLY!{Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}📁 Location: {project_path}{Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}🔄 Total iterations: {iterations}{Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}✅ All tests passing{Colors.RESET}")
-            
-            print(f"\n{Colors.BRIGHT_YELLOW}🚀 NEXT STEPS:{Colors.RESET}")
-            print(f"{Colors.YELLOW}1. cd {project_path}{Colors.RESET}")
-            print(f"{Colors.YELLOW}2. pip install -r requirements.txt{Colors.RESET}")
-            print(f"{Colors.YELLOW}3. python main.py{Colors.RESET}")
-            print(f"{Colors.YELLOW}4. Open http://localhost:5173 in your browser{Colors.RESET}")
-            
-            print(f"\n{Colors.BRIGHT_MAGENTA}✨ Your AI-built application is ready to use!{Colors.RESET}")
+            _write_lines([_FALLBACK_COMPLETION(path=project_path, iterations=iterations)])
     
-    def show_live_monitoring(self, state: Dict[str, Any]):
-        """Show live monitoring dashboard"""
-        if RICH_AVAILABLE:
+    def _get_monitor_layout(self) -> "Layout":
+        """The monitor's header/body/footer layout, built on first use"""
+        if self._monitor_layout is None:
+            from rich.layout import Layout
             layout = Layout()
             
             # Create sections
@@ -242,70 +409,64 @@ The world's first fully autonomous AI software development system!
             header_text = Text("🤖 Autonomous AI Developer - Live Monitor", style="bold cyan")
             layout["header"].update(Align.center(header_text))
             
+            # Footer
+            footer_text = Text("Press Ctrl+C to exit monitor", style="dim")
+            layout["footer"].update(Align.center(footer_text))
+            
+            self._monitor_layout = layout
+        return self._monitor_layout
+    
+    def _clock(self) -> str:
+        """Current HH:MM:SS, formatted at most once per second"""
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._time_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._last_sec = sec
+        return self._time_str
+    
+    def show_live_monitoring(self, state: Dict[str, Any]):
+        """Show live monitoring dashboard"""
+        if RICH_AVAILABLE:
+            layout = self._get_monitor_layout()
+            
             # Body with current status
             phase = state.get("phase", "UNKNOWN")
             iteration = state.get("iteration", 0)
             
-            status_table = Table(show_header=False, box=None)
+            status_table = Table.grid(padding=(0, 1))
             status_table.add_row("📍 Phase:", phase)
             status_table.add_row("🔄 Iteration:", str(iteration))
             status_table.add_row("📁 Project:", state.get("project_path", ""))
             
             layout["body"].update(Panel(status_table, title="Current Status"))
             
-            # Footer
-            footer_text = Text("Press Ctrl+C to exit monitor", style="dim")
-            layout["footer"].update(Align.center(footer_text))
-            
-            self.console.print(layout)
+            # Render the frame off-screen, then repaint from the top in one write
+            with self.console.capture() as capture:
+                self.console.print(layout)
+            self.console.file.write("\x1b[H" + capture.get())
+            self.console.file.flush()
         else:
             # Fallback monitoring
-            current_time = datetime.now().strftime("%H:%M:%S")
-            print(f"\033[2J\033[H")  # Clear screen
-            print(f"🤖 Autonomous AI Developer - Live Monitor [{current_time}]")
-            print("=" * 60)
-            
             phase = state.get("phase", "UNKNOWN")
             iteration = state.get("iteration", 0)
             
-            print(f"📍 Current Phase: {phase} (Iteration {iteration})")
-            print(f"📁 Project: {state.get('project_path', '')}")
-            
+            # Clear screen and repaint the whole frame in one write
+            frame = [
+                "\033[2J\033[H",
+                f"🤖 Autonomous AI Developer - Live Monitor [{self._clock()}]",
+                _MONITOR_RULE,
+                f"📍 Current Phase: {phase} (Iteration {iteration})",
+                f"📁 Project: {state.get('project_path', '')}"
+            ]
             if state.get('pending_approval', False):
-                print("⏸️ 🔔 WAITING FOR APPROVAL - Check generated files and approve to continue")
+                frame.append("⏸️ 🔔 WAITING FOR APPROVAL - Check generated files and approve to continue")
+            _write_lines(frame)
 
 # Create a global instance
 beautiful_cli = BeautifulCLI()
 
-# Demo function
-async def demo_beautiful_integration():
-    """Demo the beautiful CLI integrated with the autonomous system"""
-    beautiful_cli.show_banner()
-    
-    await asyncio.sleep(1)
-    
-    # Project start
-    beautiful_cli.show_project_start(
-        "Create a web-based task manager with user auth",
-        "task_manager_20241201_143022",
-        "Python"
-    )
-    
-    await asyncio.sleep(1)
-    
-    # Environment scan
-    beautiful_cli.show_phase_progress("ENV_SCAN", "Scanning environment capabilities", 15)
-    beautiful_cli.show_environment_scan({
-        'capabilities': {},
-        'available_ports': {'frontend': 5173, 'backend': 8000}
-    })
-    
-    await asyncio.sleep(1)
-    
-    # Requirements analysis
-    beautiful_cli.show_phase_progress("REQS", "AI analyzing requirements", 35)
-    
-    spec_code = '''# Task Manager Application Specification
+# Sample artifacts shown by the demo
+_DEMO_SPEC_CODE = '''# Task Manager Application Specification
 
 ## Overview
 A modern web-based task management application with user authentication.
@@ -322,15 +483,8 @@ A modern web-based task management application with user authentication.
 - Frontend: React + TypeScript
 - Database: SQLite
 - Authentication: JWT tokens'''
-    
-    beautiful_cli.show_code_generation("markdown", spec_code, "Generated Specification")
-    
-    await asyncio.sleep(1)
-    
-    # Backend development
-    beautiful_cli.show_phase_progress("BE", "AI generating backend API", 60)
-    
-    backend_code = '''from fastapi import FastAPI, HTTPException, Depends
+
+_DEMO_BACKEND_CODE = '''from fastapi import FastAPI, HTTPException, Depends
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 from database import get_db
@@ -357,20 +511,44 @@ async def create_task(
     db.commit()
     db.refresh(db_task)
     return db_task'''
+
+# Demo function
+async def demo_beautiful_integration():
+    """Demo the beautiful CLI integrated with the autonomous system"""
+    beautiful_cli.show_banner()
     
-    beautiful_cli.show_code_generation("python", backend_code, "Generated Backend API")
+    # Project start
+    beautiful_cli.show_project_start(
+        "Create a web-based task manager with user auth",
+        "task_manager_20241201_143022",
+        "Python"
+    )
+    
+    # Environment scan
+    beautiful_cli.show_phase_progress("ENV_SCAN", "Scanning environment capabilities", 15)
+    beautiful_cli.show_environment_scan({
+        'capabilities': {},
+        'available_ports': {'frontend': 5173, 'backend': 8000}
+    })
     
-    await asyncio.sleep(1)
+    # Requirements analysis
+    beautiful_cli.show_phase_progress("REQS", "AI analyzing requirements", 35)
+    
+    beautiful_cli.show_code_generation("markdown", _DEMO_SPEC_CODE, "Generated Specification")
+    
+    # Backend development
+    beautiful_cli.show_phase_progress("BE", "AI generating backend API", 60)
+    
+    beautiful_cli.show_code_generation("python", _DEMO_BACKEND_CODE, "Generated Backend API")
     
     # Testing
     beautiful_cli.show_phase_progress("TEST", "AI running comprehensive tests", 95)
     beautiful_cli.show_test_results({})
     
-    await asyncio.sleep(1)
-    
     # Completion
     beautiful_cli.show_phase_progress("FINAL", "Project completed!", 100)
     beautiful_cli.show_completion("./projects/task_manager_20241201_143022", 47)
+    beautiful_cli.close()
 
 if __name__ == "__main__":
     asyncio.run(demo_beautiful_integration())
\ No newline at end of file